@@ -1,21 +1,46 @@
 """Database configuration and session management."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from typing import AsyncIterator
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
 from app.config import settings
 
 
-# Create SQLAlchemy engine
-engine = create_engine(
+# Create async SQLAlchemy engine
+engine = create_async_engine(
     settings.database_url,
     echo=settings.db_echo,
     pool_pre_ping=True,
     pool_recycle=300,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_use_lifo=True,  # Reuse the most recently returned (warm) connection
+    query_cache_size=1200,
 )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Unpooled engine for health probes, so a saturated request pool can't
+# make the service look down (or let probes compete for pooled connections)
+health_engine = create_async_engine(
+    settings.database_url,
+    poolclass=NullPool,
+)
+
+# Create session factory. Objects are not expired on commit, so write
+# endpoints can return them without a refresh SELECT; server-generated
+# columns are loaded at flush time because the models set eager_defaults.
+# Sessions are scoped per request by the get_db dependency, so no
+# scoped_session is needed.
+AsyncSessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
 class Base(DeclarativeBase):
@@ -24,15 +49,26 @@ class Base(DeclarativeBase):
     pass
 
 
-def get_db():
+async def get_db() -> AsyncIterator[AsyncSession]:
     """Dependency to get database session."""
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db() -> None:
+async def init_db() -> None:
     """Initialize database tables."""
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def ping_db(dedicated: bool = False) -> None:
+    """
+    Run a trivial query.
+    
+    By default this goes through the request pool, opening a pooled
+    connection if none is idle. With dedicated=True it uses a fresh,
+    unpooled connection so the result reflects database reachability
+    rather than pool availability.
+    """
+    async with (health_engine if dedicated else engine).connect() as conn:
+        await conn.execute(text("SELECT 1"))
@@ -1,9 +1,13 @@
 """Custom exceptions and error handlers for the application."""
 
+import logging
 from typing import Any, Dict, Optional
 
 from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
+
+from app.responses import ORJSONResponse
+
+logger = logging.getLogger("app")
 
 
 class AppException(Exception):
@@ -82,9 +86,9 @@ class DatabaseError(AppException):
         )
 
 
-async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+async def app_exception_handler(request: Request, exc: AppException) -> ORJSONResponse:
     """Handle application exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -96,9 +100,9 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """Handle HTTP exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -110,12 +114,10 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     )
 
 
-async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def unhandled_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle unhandled exceptions."""
-    import logging
-    logger = logging.getLogger("app")
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": {
@@ -1,26 +1,49 @@
 """Logging configuration for the application."""
 
 import logging
+import queue
 import sys
-from typing import Any, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 
 from app.config import settings
 
+# Background listener that owns the real output handler
+_log_listener: Optional[QueueListener] = None
+
 
 def setup_logging() -> None:
-    """Configure application logging."""
+    """
+    Configure application logging.
+
+    Log records are enqueued by a QueueHandler on the root logger and written
+    out by a QueueListener thread, so formatting and stdout I/O never block
+    the event loop.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
     log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
 
-    # Configure root logger
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-        ],
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        logging.Formatter(
+            fmt="%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
     )
 
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+    # Configure root logger
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    root_logger.handlers = [QueueHandler(log_queue)]
+
+    _log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _log_listener.start()
+
     # Set third-party loggers to WARNING to reduce noise
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(
@@ -28,6 +51,14 @@ def setup_logging() -> None:
     )
 
 
+def shutdown_logging() -> None:
+    """Stop the queue listener, flushing any pending log records."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name."""
     return logging.getLogger(name)
@@ -1,24 +1,59 @@
 """FastAPI application entry point."""
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.orm import configure_mappers
 
 from app.config import settings
-from app.database import init_db
+from app.database import engine, health_engine, init_db, ping_db
 from app.exceptions import (
     AppException,
     app_exception_handler,
     http_exception_handler,
     unhandled_exception_handler,
 )
-from app.logging_config import get_logger, setup_logging
+from app.logging_config import get_logger, setup_logging, shutdown_logging
 from app.middleware import RequestLoggingMiddleware
-from app.routers import health_router, profile_router, jobs_router, applications_router, student_router, personalize_router, policy_router, apply_router
-from app.routers.tracker import router as tracker_router
-from app.routers.verifier import router as verifier_router
-from app.routers.audit import router as audit_router
+from app.models import JobApplication, Resume, User  # noqa: F401 - register mappers
+from app.responses import ORJSONResponse
+from app.routers import (
+    health_router,
+    profile_router,
+    jobs_router,
+    applications_router,
+    student_router,
+    personalize_router,
+    policy_router,
+    apply_router,
+    tracker_router,
+    verifier_router,
+    audit_router,
+)
+from app.services.application_assembler import shutdown_generation_pool
+from app.services.audit_log import run_audit_compactor
+from app.services.batch_processor import stop_batch_processing
+from app.routers.student import shutdown_pdf_pool
+from app.services.job_ranker import run_queue_flusher
+
+# Routers mounted under API_PREFIX, in registration order
+API_PREFIX = "/api"
+ROUTERS = (
+    health_router,
+    profile_router,
+    jobs_router,
+    applications_router,
+    student_router,
+    personalize_router,
+    policy_router,
+    apply_router,
+    tracker_router,
+    verifier_router,
+    audit_router,
+)
 
 # Setup logging
 setup_logging()
@@ -33,20 +68,53 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting {settings.app_name} in {settings.app_env} mode")
     logger.info(f"Debug mode: {settings.debug}")
 
+    # Raise the shared threadpool cap (40 by default) so blocking service
+    # calls don't queue up behind each other under concurrent load
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.thread_pool_size
+
     # Initialize database tables (optional, use Alembic migrations in production)
     if settings.app_env == "development":
         try:
-            init_db()
+            await init_db()
             logger.info("Database tables initialized")
         except Exception as e:
             logger.warning(f"Database initialization skipped: {e}")
 
+    # Warm one-time costs so the first requests after boot don't pay them:
+    # mapper configuration, Pydantic schema generation for every route and
+    # an initial pooled connection
+    configure_mappers()
+    app.openapi()
+    try:
+        await asyncio.wait_for(ping_db(), timeout=5)
+    except Exception as e:
+        logger.warning(f"Database connection warm-up skipped: {e}")
+
+    # Coalesce apply queue writes in the background
+    queue_flusher = asyncio.create_task(run_queue_flusher())
+
+    # Drop expired audit events at startup and daily after that
+    audit_compactor = None
+    if settings.audit_retention_days > 0:
+        audit_compactor = asyncio.create_task(run_audit_compactor(settings.audit_retention_days))
+
     yield
 
     # Shutdown
     logger.info("Shutting down application")
-    from app.services.batch_processor import stop_batch_processing
     stop_batch_processing()
+    shutdown_pdf_pool()
+    shutdown_generation_pool()
+    queue_flusher.cancel()  # Flushes pending queue changes on the way out
+    with suppress(asyncio.CancelledError):
+        await queue_flusher
+    if audit_compactor is not None:
+        audit_compactor.cancel()
+        with suppress(asyncio.CancelledError):
+            await audit_compactor
+    await engine.dispose()
+    await health_engine.dispose()
+    shutdown_logging()
 
 
 # Create FastAPI application
@@ -57,6 +125,7 @@ app = FastAPI(
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -77,17 +146,8 @@ app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(Exception, unhandled_exception_handler)
 
 # Include routers
-app.include_router(health_router, prefix="/api")
-app.include_router(profile_router, prefix="/api")
-app.include_router(jobs_router, prefix="/api")
-app.include_router(applications_router, prefix="/api")
-app.include_router(student_router, prefix="/api")
-app.include_router(personalize_router, prefix="/api")
-app.include_router(policy_router, prefix="/api")
-app.include_router(apply_router, prefix="/api")
-app.include_router(tracker_router, prefix="/api")
-app.include_router(verifier_router, prefix="/api")
-app.include_router(audit_router, prefix="/api")
+for router in ROUTERS:
+    app.include_router(router, prefix=API_PREFIX)
 
 
 @app.get("/")
@@ -1,7 +1,9 @@
 """Middleware for the FastAPI application."""
 
-import time
-import uuid
+import itertools
+import logging
+import secrets
+from time import perf_counter
 from typing import Callable
 
 from fastapi import Request, Response
@@ -11,42 +13,48 @@ from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Request IDs: a per-process random prefix plus a monotonically increasing counter
+_REQ_PREFIX = secrets.token_hex(1)
+_REQ_COUNTER = itertools.count()
+
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Middleware to log incoming requests and responses."""
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process the request and log details."""
-        request_id = str(uuid.uuid4())[:8]
-        start_time = time.time()
+        request_id = f"{_REQ_PREFIX}{next(_REQ_COUNTER) & 0xFFFFFF:06x}"
+        start_time = perf_counter()
 
         # Add request ID to request state
         request.state.request_id = request_id
 
-        # Log incoming request
-        logger.info(
-            f"[{request_id}] --> {request.method} {request.url.path}"
-        )
+        # Arrival is only logged at DEBUG; the completion line carries the
+        # same method/path plus status and duration
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] --> %s %s", request_id, request.method, request.url.path)
 
         # Process request
         try:
             response = await call_next(request)
         except Exception as e:
-            process_time = time.time() - start_time
+            process_time = perf_counter() - start_time
             logger.error(
-                f"[{request_id}] <-- {request.method} {request.url.path} | "
-                f"ERROR | {process_time:.3f}s | {str(e)}"
+                "[%s] <-- %s %s | ERROR | %.3fs | %s",
+                request_id, request.method, request.url.path, process_time, e,
             )
             raise
 
-        # Calculate processing time
-        process_time = time.time() - start_time
-
-        # Log response
-        logger.info(
-            f"[{request_id}] <-- {request.method} {request.url.path} | "
-            f"{response.status_code} | {process_time:.3f}s"
-        )
+        # Log response (checked per request since the level is configured
+        # after this module is imported; the logger caches the result)
+        if logger.isEnabledFor(logging.INFO):
+            process_time = perf_counter() - start_time
+            logger.log(
+                logging.INFO,
+                "[%s] <-- %s %s | %d | %.3fs",
+                request_id, request.method, request.url.path,
+                response.status_code, process_time,
+            )
 
         # Add request ID to response headers
         response.headers["X-Request-ID"] = request_id
@@ -0,0 +1,35 @@
+"""Custom response classes for the FastAPI application."""
+
+from typing import Any, Optional
+
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from data version parts (e.g. counters, mtimes)."""
+    return 'W/"' + "-".join(str(p) for p in parts) + '"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Return a 304 response if the request's If-None-Match matches ``etag``.
+    
+    Returns None when the client has no matching cached copy and the full
+    response should be sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    if etag in tags or "*" in tags:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
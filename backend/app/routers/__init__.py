@@ -9,6 +9,8 @@ from app.routers.personalize import router as personalize_router
 from app.routers.policy import router as policy_router
 from app.routers.apply import router as apply_router
 from app.routers.tracker import router as tracker_router
+from app.routers.verifier import router as verifier_router
+from app.routers.audit import router as audit_router
 
 __all__ = [
     "health_router",
@@ -20,5 +22,6 @@ __all__ = [
     "policy_router",
     "apply_router",
     "tracker_router",
+    "verifier_router",
+    "audit_router",
 ]
-
@@ -1,18 +1,19 @@
 """Applications API endpoints."""
 
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.services import (
-    load_applications,
     save_application,
     update_application,
     get_application_by_id,
-    get_applications_by_status,
+    query_applications,
     delete_application,
     get_application_stats,
+    get_applications_version,
     get_job_by_id,
 )
 from app.logging_config import get_logger
@@ -21,6 +22,33 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/applications", tags=["Applications"])
 
+# Valid application statuses (ordered for error messages)
+VALID_STATUSES = ("pending", "applied", "interviewing", "offered", "rejected", "withdrawn")
+_VALID_STATUS_SET = frozenset(VALID_STATUSES)
+_INVALID_STATUS_MESSAGE = f"Invalid status. Must be one of: {', '.join(VALID_STATUSES)}"
+
+# Serialized GET responses, keyed by endpoint + query and tagged with the
+# applications data version they were built from
+_response_cache: Dict[Tuple[Any, ...], Tuple[Tuple[int, int], bytes]] = {}
+_RESPONSE_CACHE_MAX_ENTRIES = 256
+
+
+def _cached_json_response(key: Tuple[Any, ...], build: Callable[[], bytes]) -> Response:
+    """
+    Return a cached JSON response for `key`, rebuilding the body with
+    `build` if the applications data has changed since it was cached.
+    """
+    version = get_applications_version()
+    cached = _response_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return Response(content=cached[1], media_type="application/json")
+    
+    body = build()
+    if len(_response_cache) >= _RESPONSE_CACHE_MAX_ENTRIES:
+        _response_cache.clear()
+    _response_cache[key] = (version, body)
+    return Response(content=body, media_type="application/json")
+
 
 # ============================================================
 # Pydantic Schemas
@@ -96,6 +124,11 @@ class ApplicationStatsResponse(BaseModel):
     withdrawn: int
 
 
+# Validates stored dicts (defaults, dropping extra fields such as
+# application_package) and serializes straight to JSON bytes
+_APPLICATION_LIST_ADAPTER = TypeAdapter(List[ApplicationResponse])
+
+
 # ============================================================
 # API Endpoints
 # ============================================================
@@ -105,30 +138,28 @@ async def list_applications(
     status: Optional[str] = Query(None, description="Filter by status"),
     search: Optional[str] = Query(None, description="Search in company and title"),
     company: Optional[str] = Query(None, description="Filter by company"),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Page size (all if omitted)"),
+    offset: int = Query(0, ge=0, description="Number of applications to skip"),
 ):
     """
-    List all applications with optional filtering.
-    """
-    if status:
-        applications = get_applications_by_status(status)
-    else:
-        applications = load_applications()
-    
-    # Apply additional filters
-    if search:
-        search_lower = search.lower()
-        applications = [a for a in applications if 
-                       search_lower in a.get("company_name", "").lower() or 
-                       search_lower in a.get("job_title", "").lower()]
-    
-    if company:
-        applications = [a for a in applications if 
-                       company.lower() in a.get("company_name", "").lower()]
+    List all applications with optional filtering and pagination.
     
-    # Sort by updated_at descending
-    applications.sort(key=lambda x: x.get("updated_at", ""), reverse=True)
+    `total` is the number of matching applications before pagination.
+    """
+    def build() -> bytes:
+        applications, total = query_applications(
+            status=status,
+            search=search,
+            company=company,
+            limit=limit,
+            offset=offset,
+        )
+        items = _APPLICATION_LIST_ADAPTER.dump_json(
+            _APPLICATION_LIST_ADAPTER.validate_python(applications)
+        )
+        return b'{"applications":' + items + b',"total":' + str(total).encode() + b"}"
     
-    return ApplicationListResponse(applications=applications, total=len(applications))
+    return _cached_json_response(("list", status, search, company, limit, offset), build)
 
 
 @router.get("/stats", response_model=ApplicationStatsResponse)
@@ -136,8 +167,8 @@ async def get_stats():
     """
     Get application statistics.
     """
-    stats = get_application_stats()
-    return stats
+    # Stats are built by the data store with exactly the response fields
+    return _cached_json_response(("stats",), lambda: orjson.dumps(get_application_stats()))
 
 
 @router.post("", response_model=ApplicationResponse, status_code=201)
@@ -163,12 +194,11 @@ async def create_application(application: ApplicationCreate):
             if not app_data.get("remote"):
                 app_data["remote"] = job.get("remote", False)
     
-    app_id = save_application(app_data)
+    created_app = save_application(app_data)
     
-    if not app_id:
+    if not created_app:
         raise HTTPException(status_code=500, detail="Failed to create application")
     
-    created_app = get_application_by_id(app_id)
     return created_app
 
 
@@ -197,10 +227,11 @@ async def update_application_endpoint(app_id: str, app_update: ApplicationUpdate
     
     update_data = app_update.model_dump(exclude_unset=True)
     
-    if not update_application(app_id, update_data):
+    updated_app = update_application(app_id, update_data)
+    if not updated_app:
         raise HTTPException(status_code=500, detail="Failed to update application")
     
-    return get_application_by_id(app_id)
+    return updated_app
 
 
 @router.patch("/{app_id}/status", response_model=ApplicationResponse)
@@ -210,23 +241,19 @@ async def update_status(app_id: str, status: str):
     
     Valid statuses: pending, applied, interviewing, offered, rejected, withdrawn
     """
-    valid_statuses = ["pending", "applied", "interviewing", "offered", "rejected", "withdrawn"]
-    
-    if status not in valid_statuses:
-        raise HTTPException(
-            status_code=400, 
-            detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
-        )
+    if status not in _VALID_STATUS_SET:
+        raise HTTPException(status_code=400, detail=_INVALID_STATUS_MESSAGE)
     
     existing = get_application_by_id(app_id)
     
     if not existing:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    if not update_application(app_id, {"status": status}):
+    updated_app = update_application(app_id, {"status": status})
+    if not updated_app:
         raise HTTPException(status_code=500, detail="Failed to update status")
     
-    return get_application_by_id(app_id)
+    return updated_app
 
 
 @router.delete("/{app_id}", status_code=204)
@@ -264,9 +291,9 @@ async def create_from_job(job_id: str, notes: Optional[str] = None):
         "notes": notes,
     }
     
-    app_id = save_application(app_data)
+    created_app = save_application(app_data)
     
-    if not app_id:
+    if not created_app:
         raise HTTPException(status_code=500, detail="Failed to create application")
     
-    return get_application_by_id(app_id)
+    return created_app
@@ -1,13 +1,18 @@
 """Apply API endpoints."""
 
+import math
+
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Dict, Any, Optional, List
 
 from app.services.application_assembler import assemble_application_package, AssemblerError
-from app.services.auto_submit import submit_application, SubmissionError
+from app.services.auto_submit import submit_application, CircuitOpen, SubmissionError
 from app.services.batch_processor import start_batch_processing, stop_batch_processing, get_batch_status
+from app.services.job_ranker import get_queued_jobs, remove_queued_job, reorder_queue
 from app.logging_config import get_logger
+from app.responses import ORJSONResponse
 
 logger = get_logger(__name__)
 
@@ -26,8 +31,8 @@ class StartBatchRequest(BaseModel):
     """Request schema for starting batch processing."""
     student_id: Optional[str] = None
 
-@router.post("/assemble", response_model=Dict[str, Any])
-def assemble_package(request: AssembleApplicationRequest):
+@router.post("/assemble", response_model=None)
+async def assemble_package(request: AssembleApplicationRequest):
     """
     Assemble a complete application package.
     
@@ -35,8 +40,10 @@ def assemble_package(request: AssembleApplicationRequest):
     Returns the full JSON package and saves a record.
     """
     try:
-        package = assemble_application_package(request.job_id, request.profile_data)
-        return package
+        package = await run_in_threadpool(
+            assemble_application_package, request.job_id, request.profile_data
+        )
+        return ORJSONResponse(package)
         
     except AssemblerError as e:
         logger.error(f"Assembly error: {e}")
@@ -46,7 +53,7 @@ def assemble_package(request: AssembleApplicationRequest):
         logger.error(f"Unexpected error assembling application: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@router.post("/submit", response_model=Dict[str, Any])
+@router.post("/submit", response_model=None)
 async def submit_package(request: SubmitApplicationRequest):
     """
     Submit an assembled application to the Sandbox Portal.
@@ -56,7 +63,16 @@ async def submit_package(request: SubmitApplicationRequest):
     """
     try:
         result = await submit_application(request.job_id)
-        return result
+        return ORJSONResponse(result)
+        
+    except CircuitOpen as e:
+        # The sandbox is down, not the request; tell the client when to retry
+        logger.warning("Submission refused: %s", e)
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+        )
         
     except SubmissionError as e:
         logger.error(f"Submission error: {e}")
@@ -68,43 +84,40 @@ async def submit_package(request: SubmitApplicationRequest):
 
 # Batch Endpoints
 
-@router.post("/batch/start", response_model=Dict[str, Any])
-def start_batch(request: StartBatchRequest):
+@router.post("/batch/start", response_model=None)
+async def start_batch(request: StartBatchRequest):
     """Start the autonomous batch application process."""
-    return start_batch_processing(request.student_id)
+    return ORJSONResponse(await run_in_threadpool(start_batch_processing, request.student_id))
 
-@router.post("/batch/stop", response_model=Dict[str, Any])
-def stop_batch():
+@router.post("/batch/stop", response_model=None)
+async def stop_batch():
     """Stop the batch application process."""
-    return stop_batch_processing()
+    return ORJSONResponse(await run_in_threadpool(stop_batch_processing))
 
-@router.get("/batch/status", response_model=Dict[str, Any])
-def batch_status():
+@router.get("/batch/status", response_model=None)
+async def batch_status():
     """Get the current status of the batch process."""
-    return get_batch_status()
+    return ORJSONResponse(await run_in_threadpool(get_batch_status))
 
 # Queue Management Endpoints
 
-@router.get("/queue", response_model=Dict[str, Any])
-def get_queue():
+@router.get("/queue", response_model=None)
+async def get_queue():
     """Get current apply queue."""
-    from app.services.job_ranker import get_queued_jobs
-    return {"queue": get_queued_jobs()}
+    return ORJSONResponse({"queue": await run_in_threadpool(get_queued_jobs)})
 
-@router.delete("/queue/{job_id}", response_model=Dict[str, Any])
-def remove_from_queue(job_id: str):
+@router.delete("/queue/{job_id}", response_model=None)
+async def remove_from_queue(job_id: str):
     """Remove a job from the queue."""
-    from app.services.job_ranker import remove_queued_job
-    if remove_queued_job(job_id):
+    if await run_in_threadpool(remove_queued_job, job_id):
         return {"success": True, "message": "Job removed from queue"}
     raise HTTPException(status_code=404, detail="Job not found in queue")
 
 class ReorderRequest(BaseModel):
     job_ids: List[str]
 
-@router.post("/queue/reorder", response_model=Dict[str, Any])
-def reorder_queue_endpoint(request: ReorderRequest):
+@router.post("/queue/reorder", response_model=None)
+async def reorder_queue_endpoint(request: ReorderRequest):
     """Reorder queue based on ID list."""
-    from app.services.job_ranker import reorder_queue
-    new_queue = reorder_queue(request.job_ids)
-    return {"success": True, "queue": new_queue}
+    new_queue = await run_in_threadpool(reorder_queue, request.job_ids)
+    return ORJSONResponse({"success": True, "queue": new_queue})
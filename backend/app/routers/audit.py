@@ -1,7 +1,10 @@
 
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any
+from typing import Optional
 
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+
+from app.responses import ORJSONResponse
 from app.services.audit_log import get_audit_trail
 
 router = APIRouter(
@@ -9,11 +12,18 @@ router = APIRouter(
     tags=["Audit"]
 )
 
-@router.get("/application/{job_id}", response_model=List[Dict[str, Any]])
-def get_application_audit(job_id: str):
+@router.get("/application/{job_id}", response_model=None)
+async def get_application_audit(
+    job_id: str,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    event_type: Optional[str] = None,
+):
     """
-    Get the complete audit trail for a specific job application.
+    Get the audit trail for a specific job application, oldest event first.
+    
+    Optionally filter by event type (e.g. snapshot, generation, policy).
     """
-    logs = get_audit_trail(job_id)
+    logs = await run_in_threadpool(get_audit_trail, job_id, limit, offset, event_type)
     # Return empty list if no logs, that's valid
-    return logs
+    return ORJSONResponse(logs)
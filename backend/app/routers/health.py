@@ -1,13 +1,34 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+import asyncio
+import time
+from typing import Any, Dict
 
-from app.database import get_db
+from fastapi import APIRouter
+
+from app.database import ping_db
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
+# Seconds a database probe result is reused before the DB is hit again
+DB_HEALTH_TTL = 5.0
+
+# Seconds to wait for the probe before reporting the database as down
+DB_HEALTH_TIMEOUT = 5.0
+
+# Last probe result and when it was taken (time.monotonic())
+_db_health: Dict[str, Any] = {"ts": 0.0, "result": None}
+_db_health_lock = asyncio.Lock()
+
+
+async def _probe_database() -> Dict[str, Any]:
+    """Run a single connectivity probe against the database."""
+    try:
+        await asyncio.wait_for(ping_db(dedicated=True), timeout=DB_HEALTH_TIMEOUT)
+        return {"status": "healthy", "database": "connected"}
+    except Exception as e:
+        return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
+
 
 @router.get("")
 async def health_check():
@@ -16,10 +37,16 @@ async def health_check():
 
 
 @router.get("/db")
-async def database_health_check(db: Session = Depends(get_db)):
-    """Check database connectivity."""
-    try:
-        db.execute(text("SELECT 1"))
-        return {"status": "healthy", "database": "connected"}
-    except Exception as e:
-        return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
+async def database_health_check():
+    """
+    Check database connectivity.
+
+    The probe result is cached for DB_HEALTH_TTL seconds so frequent
+    load balancer polls don't each cost a database round trip.
+    """
+    async with _db_health_lock:
+        # Only one request re-probes; concurrent callers reuse its result
+        if _db_health["result"] is None or time.monotonic() - _db_health["ts"] >= DB_HEALTH_TTL:
+            _db_health["result"] = await _probe_database()
+            _db_health["ts"] = time.monotonic()
+        return _db_health["result"]
@@ -1,18 +1,26 @@
 """Jobs API endpoints."""
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.services import (
-    load_jobs,
-    save_jobs,
+    query_jobs,
     add_job,
+    add_jobs,
     get_job_by_id,
+    update_job as update_stored_job,
+    toggle_job_favorite,
     delete_job,
+    get_jobs_version,
 )
+from app.services.job_ranker import add_to_apply_queue, rank_jobs_cached as service_rank_jobs
+from app.services.job_search import get_stored_jobs, search_and_store_jobs
 from app.logging_config import get_logger
+from app.responses import make_etag, not_modified
 
 logger = get_logger(__name__)
 
@@ -80,12 +88,36 @@ class JobListResponse(BaseModel):
     total: int
 
 
+_JOB_LIST_ADAPTER = TypeAdapter(List[JobResponse])
+
+# Jobs serialized per chunk when streaming a job list
+STREAM_CHUNK_SIZE = 256
+
+
+def _stream_jobs(jobs: List[JobResponse]) -> Iterator[bytes]:
+    """
+    Serialize a JobListResponse body incrementally.
+    
+    Jobs are dumped in chunks so the first bytes go out before the whole
+    list is serialized and the full body is never held in memory at once.
+    The jobs must already be validated: once streaming starts the status
+    can no longer be changed to report an error.
+    """
+    yield b'{"jobs":['
+    for start in range(0, len(jobs), STREAM_CHUNK_SIZE):
+        # Strip the enclosing brackets so chunks join into a single array
+        body = _JOB_LIST_ADAPTER.dump_json(jobs[start:start + STREAM_CHUNK_SIZE])[1:-1]
+        yield body if start == 0 else b"," + body
+    yield b'],"total":' + str(len(jobs)).encode() + b"}"
+
+
 # ============================================================
 # API Endpoints
 # ============================================================
 
 @router.get("", response_model=JobListResponse)
 async def list_jobs(
+    request: Request,
     search: Optional[str] = Query(None, description="Search in title and company"),
     company: Optional[str] = Query(None, description="Filter by company"),
     location: Optional[str] = Query(None, description="Filter by location"),
@@ -95,32 +127,34 @@ async def list_jobs(
 ):
     """
     List all jobs with optional filtering.
-    """
-    jobs = load_jobs()
-    
-    # Apply filters
-    if search:
-        search_lower = search.lower()
-        jobs = [j for j in jobs if 
-                search_lower in j.get("title", "").lower() or 
-                search_lower in j.get("company", "").lower()]
-    
-    if company:
-        jobs = [j for j in jobs if company.lower() in j.get("company", "").lower()]
-    
-    if location:
-        jobs = [j for j in jobs if location.lower() in j.get("location", "").lower()]
     
-    if remote is not None:
-        jobs = [j for j in jobs if j.get("remote") == remote]
-    
-    if job_type:
-        jobs = [j for j in jobs if j.get("job_type") == job_type]
-    
-    if is_favorite is not None:
-        jobs = [j for j in jobs if j.get("is_favorite") == is_favorite]
+    Responses carry an ETag derived from the jobs data version, so polling
+    clients get a bodyless 304 until the jobs change.
+    """
+    # Taken before reading so a concurrent write can only make it stale
+    etag = make_etag(*get_jobs_version())
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    
+    # Filtering reads the jobs file on a cache miss, so keep it off the event loop
+    jobs = await run_in_threadpool(
+        query_jobs,
+        search=search,
+        company=company,
+        location=location,
+        remote=remote,
+        job_type=job_type,
+        is_favorite=is_favorite,
+    )
+    # Validate up front so a bad record fails the request with a 500 rather
+    # than truncating a 200 body. The models also copy the job fields, so the
+    # stream doesn't read cached records that later updates modify in place.
+    jobs = await run_in_threadpool(_JOB_LIST_ADAPTER.validate_python, jobs)
     
-    return JobListResponse(jobs=jobs, total=len(jobs))
+    return StreamingResponse(
+        _stream_jobs(jobs), media_type="application/json", headers={"ETag": etag}
+    )
 
 
 @router.post("", response_model=JobResponse, status_code=201)
@@ -156,23 +190,16 @@ async def update_job(job_id: str, job_update: JobUpdate):
     """
     Update a job entry.
     """
-    existing_job = get_job_by_id(job_id)
-    
-    if not existing_job:
+    if not get_job_by_id(job_id):
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # Merge updates
     update_data = job_update.model_dump(exclude_unset=True)
-    existing_job.update(update_data)
-    
-    # Save all jobs
-    jobs = load_jobs()
-    jobs = [existing_job if j.get("id") == job_id else j for j in jobs]
+    updated_job = update_stored_job(job_id, update_data)
     
-    if not save_jobs(jobs):
+    if not updated_job:
         raise HTTPException(status_code=500, detail="Failed to update job")
     
-    return get_job_by_id(job_id)
+    return updated_job
 
 
 @router.delete("/{job_id}", status_code=204)
@@ -194,18 +221,12 @@ async def toggle_favorite(job_id: str):
     """
     Toggle the favorite status of a job.
     """
-    job = get_job_by_id(job_id)
-    
-    if not job:
+    if not get_job_by_id(job_id):
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job["is_favorite"] = not job.get("is_favorite", False)
+    job = toggle_job_favorite(job_id)
     
-    # Save all jobs
-    jobs = load_jobs()
-    jobs = [job if j.get("id") == job_id else j for j in jobs]
-    
-    if not save_jobs(jobs):
+    if not job:
         raise HTTPException(status_code=500, detail="Failed to update job")
     
     return job
@@ -216,21 +237,15 @@ async def bulk_create_jobs(jobs: List[JobCreate]):
     """
     Create multiple jobs at once.
     """
-    existing_jobs = load_jobs()
-    new_jobs = []
-    
-    for job in jobs:
-        job_data = job.model_dump()
-        new_jobs.append(job_data)
-    
-    all_jobs = existing_jobs + new_jobs
+    all_jobs = add_jobs([job.model_dump() for job in jobs])
     
-    if not save_jobs(all_jobs):
+    if all_jobs is None:
         raise HTTPException(status_code=500, detail="Failed to save jobs")
     
-    # Reload to get IDs
-    saved_jobs = load_jobs()
-    return JobListResponse(jobs=saved_jobs, total=len(saved_jobs))
+    # Validated before streaming, as in list_jobs
+    all_jobs = await run_in_threadpool(_JOB_LIST_ADAPTER.validate_python, all_jobs)
+    
+    return StreamingResponse(_stream_jobs(all_jobs), media_type="application/json")
 
 
 # ============================================================
@@ -263,8 +278,6 @@ async def search_jobs(request: JobSearchRequest):
     """
     Search for jobs from external sources (sandbox) based on constraints.
     """
-    from app.services.job_search import search_and_store_jobs
-    
     result = await search_and_store_jobs(
         required_skills=request.required_skills,
         preferred_locations=request.preferred_locations,
@@ -303,10 +316,6 @@ async def rank_jobs(request: JobRankRequest):
     """
     Rank stored jobs based on profile match and queue top candidates.
     """
-    from app.services.job_search import get_stored_jobs
-    from app.services.job_ranker import rank_jobs as service_rank_jobs
-    from app.services.job_ranker import add_to_apply_queue
-    
     # Get currently stored jobs
     # First try 'new' jobs, then fallback to all if search just happened
     jobs = get_stored_jobs(status="new", limit=100)
@@ -346,13 +355,9 @@ async def queue_job_endpoint(job_id: str):
     """
     Manually add a specific job to the apply queue.
     """
-    from app.services.data_store import get_job_by_id
-    from app.services.job_ranker import add_to_apply_queue
-    
     job = get_job_by_id(job_id)
     if not job:
         # Check storage if not in main db
-        from app.services.job_search import get_stored_jobs
         all_jobs = get_stored_jobs(status=None, limit=500)
         job = next((j for j in all_jobs if j["id"] == job_id), None)
         
@@ -12,6 +12,7 @@ from app.services.apply_policy import (
     PolicyError
 )
 from app.logging_config import get_logger
+from app.responses import ORJSONResponse
 
 logger = get_logger(__name__)
 
@@ -31,24 +32,24 @@ class PolicyCheckResponse(BaseModel):
     reason: str
     policy_snapshot: Dict[str, Any]
 
-@router.get("/", response_model=Dict[str, Any])
+@router.get("/", response_model=None)
 async def get_current_policy():
     """Get the current application policy."""
-    return get_policy()
+    return ORJSONResponse(get_policy())
 
-@router.post("/set", response_model=Dict[str, Any])
+@router.post("/set", response_model=None)
 async def update_policy(request: PolicyUpdateRequest):
     """Update application policy settings."""
     try:
         updates = request.dict(exclude_unset=True)
-        return set_policy(updates)
+        return ORJSONResponse(set_policy(updates))
     except PolicyError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error updating policy: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@router.post("/pause-all", response_model=Dict[str, Any])
+@router.post("/pause-all", response_model=None)
 async def pause_applications():
     """Immediately pause all automated applications."""
     if pause_all_applications():
@@ -1,12 +1,17 @@
 """Student profile API endpoints."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, EmailStr, Field
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
-from app.services import load_student_profile, save_student_profile
+from app.services import (
+    get_student_profile_version,
+    load_student_profile,
+    save_student_profile,
+)
 from app.logging_config import get_logger
+from app.responses import ORJSONResponse, make_etag, not_modified
 
 logger = get_logger(__name__)
 
@@ -60,81 +65,157 @@ class StudentProfileCreate(BaseModel):
     expected_salary_max: Optional[int] = None
 
 
+class StudentProfileUpdate(BaseModel):
+    """Schema for partially updating student profile. Unknown fields are rejected."""
+    model_config = ConfigDict(extra="forbid")
+
+    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    email: Optional[EmailStr] = None
+    phone: Optional[str] = Field(None, max_length=20)
+    location: Optional[str] = Field(None, max_length=255)
+    linkedin_url: Optional[str] = None
+    github_url: Optional[str] = None
+    portfolio_url: Optional[str] = None
+    summary: Optional[str] = None
+    skills: Optional[list[str]] = None
+    education: Optional[list[Education]] = None
+    experience: Optional[list[Experience]] = None
+    certifications: Optional[list[str]] = None
+    languages: Optional[list[str]] = None
+    preferred_job_types: Optional[list[str]] = None
+    preferred_locations: Optional[list[str]] = None
+    remote_preference: Optional[str] = None
+    expected_salary_min: Optional[int] = None
+    expected_salary_max: Optional[int] = None
+
+
 class StudentProfileResponse(StudentProfileCreate):
     """Schema for profile response."""
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
 
 
+# ============================================================
+# Legacy Profile Migration
+# ============================================================
+
+def _parse_gpa(gpa: Any) -> Optional[float]:
+    """Parse a GPA such as 3.7 or "3.7/4.0" into a float."""
+    if not gpa:
+        return None
+    try:
+        return float(str(gpa).split("/")[0])
+    except ValueError:
+        return None
+
+
+def _normalize_education(edu: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a legacy education entry onto the Education schema fields."""
+    return {
+        **edu,
+        "institution": edu.get("institution", ""),
+        "degree": edu.get("degree", ""),
+        "field_of_study": edu.get("field_of_study"),
+        "start_year": edu.get("start_year"),
+        "end_year": edu.get("end_year"),
+        "gpa": _parse_gpa(edu.get("gpa")),
+    }
+
+
+def _normalize_experience(exp: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a legacy experience entry onto the Experience schema fields."""
+    return {
+        **exp,
+        "company": exp.get("company", ""),
+        "title": exp.get("title") or exp.get("role", ""),
+        "location": exp.get("location"),
+        "start_date": exp.get("start_date"),
+        "end_date": exp.get("end_date"),
+        "current": exp.get("current", False),
+        "description": exp.get("description"),
+    }
+
+
+def _flatten_legacy_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a legacy profile (nested personal_info/links) to the flat format.
+    
+    Fields outside the profile schema (e.g. projects, links.other and the
+    legacy role/duration/responsibilities of experience entries) are carried
+    over unchanged.
+    """
+    personal_info = profile.get("personal_info") or {}
+    links = profile.get("links") or {}
+    
+    flat = {k: v for k, v in profile.items() if k != "personal_info"}
+    flat.update({
+        "name": personal_info.get("name", ""),
+        "email": (personal_info.get("email") or "").replace("#", ""),  # Remove # if present
+        "phone": personal_info.get("phone"),
+        "location": personal_info.get("location"),
+        "linkedin_url": links.get("linkedin"),
+        "github_url": links.get("github"),
+        "portfolio_url": links.get("portfolio"),
+        "summary": profile.get("summary", ""),
+        "skills": profile.get("skills", []),
+        "education": [_normalize_education(edu) for edu in profile.get("education", [])],
+        "experience": [_normalize_experience(exp) for exp in profile.get("experience", [])],
+        "certifications": profile.get("certifications", []),
+        "languages": profile.get("languages", []),
+        "preferred_job_types": profile.get("preferred_job_types", []),
+        "preferred_locations": profile.get("preferred_locations", []),
+    })
+    return flat
+
+
+# Flat view of a legacy profile, keyed by the profile data version. The
+# legacy shape stays on disk because the resume extraction endpoint writes
+# it and the tailoring services read it.
+_flat_profile_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
+
+def _flat_profile(profile: Dict[str, Any], version: Tuple[int, int]) -> Dict[str, Any]:
+    """Flatten a legacy profile, reusing the result until the profile changes."""
+    global _flat_profile_cache
+    cached = _flat_profile_cache
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    flat = _flatten_legacy_profile(profile)
+    _flat_profile_cache = (version, flat)
+    return flat
+
+
 # ============================================================
 # API Endpoints
 # ============================================================
 
 @router.get("", response_model=Optional[StudentProfileResponse])
-async def get_profile():
+async def get_profile(request: Request, response: Response):
     """
     Get the current student profile.
     
     Returns the student profile if it exists, otherwise returns null.
+    Responses carry an ETag so unchanged profiles are answered with 304.
     """
+    version = get_student_profile_version()
+    etag = make_etag(*version)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    
     profile = load_student_profile()
+    response.headers["ETag"] = etag
     if profile is None:
         return None
     
     # Transform legacy nested format to flat format if needed
     if "personal_info" in profile:
-        personal_info = profile.get("personal_info", {})
-        links = profile.get("links", {})
-        
-        transformed = {
-            "name": personal_info.get("name", ""),
-            "email": personal_info.get("email", "").replace("#", ""),  # Remove # if present
-            "phone": personal_info.get("phone"),
-            "location": personal_info.get("location"),
-            "linkedin_url": links.get("linkedin"),
-            "github_url": links.get("github"),
-            "portfolio_url": links.get("portfolio"),
-            "summary": profile.get("summary", ""),
-            "skills": profile.get("skills", []),
-            "education": [
-                {
-                    "institution": edu.get("institution", ""),
-                    "degree": edu.get("degree", ""),
-                    "field_of_study": edu.get("field_of_study"),
-                    "start_year": edu.get("start_year"),
-                    "end_year": edu.get("end_year"),
-                    "gpa": float(str(edu.get("gpa", "0")).split("/")[0]) if edu.get("gpa") else None
-                }
-                for edu in profile.get("education", [])
-            ],
-            "experience": [
-                {
-                    "company": exp.get("company", ""),
-                    "title": exp.get("title", ""),
-                    "location": exp.get("location"),
-                    "start_date": exp.get("start_date"),
-                    "end_date": exp.get("end_date"),
-                    "current": exp.get("current", False),
-                    "description": exp.get("description")
-                }
-                for exp in profile.get("experience", [])
-            ],
-            "certifications": profile.get("certifications", []),
-            "languages": profile.get("languages", []),
-            "preferred_job_types": profile.get("preferred_job_types", []),
-            "preferred_locations": profile.get("preferred_locations", []),
-            "remote_preference": profile.get("remote_preference"),
-            "expected_salary_min": profile.get("expected_salary_min"),
-            "expected_salary_max": profile.get("expected_salary_max"),
-            "created_at": profile.get("created_at"),
-            "updated_at": profile.get("updated_at")
-        }
-        return transformed
+        return _flat_profile(profile, version)
     
     return profile
 
 
-@router.post("", response_model=StudentProfileResponse)
+@router.post("", response_model=None, responses={200: {"model": StudentProfileResponse}})
 async def create_or_update_profile(profile: StudentProfileCreate):
     """
     Create or update the student profile.
@@ -144,23 +225,20 @@ async def create_or_update_profile(profile: StudentProfileCreate):
     """
     profile_data = profile.model_dump()
     
-    # Preserve created_at if updating
-    existing = load_student_profile()
-    if existing and "created_at" in existing:
-        profile_data["created_at"] = existing["created_at"]
-    
+    # save_student_profile keeps the stored created_at when updating
     success = save_student_profile(profile_data)
     
     if not success:
         raise HTTPException(status_code=500, detail="Failed to save profile")
     
-    # Return the saved profile
-    saved_profile = load_student_profile()
-    return saved_profile
+    # save_student_profile stamps the timestamps onto profile_data in place,
+    # so it already matches what was written. It is a dump of the validated
+    # request model, so skip FastAPI's response validation pass.
+    return ORJSONResponse(profile_data)
 
 
 @router.patch("", response_model=StudentProfileResponse)
-async def partial_update_profile(updates: Dict[str, Any]):
+async def partial_update_profile(updates: StudentProfileUpdate):
     """
     Partially update the student profile.
     
@@ -171,15 +249,15 @@ async def partial_update_profile(updates: Dict[str, Any]):
     if existing is None:
         raise HTTPException(status_code=404, detail="Profile not found. Create one first.")
     
-    # Merge updates with existing data
-    existing.update(updates)
+    # Merge only the fields the client sent
+    existing.update(updates.model_dump(exclude_unset=True))
     
     success = save_student_profile(existing)
     
     if not success:
         raise HTTPException(status_code=500, detail="Failed to update profile")
     
-    return load_student_profile()
+    return existing
 
 
 @router.delete("", status_code=204)
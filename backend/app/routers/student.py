@@ -1,8 +1,13 @@
 """Student API endpoints including resume upload."""
 
+import asyncio
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi import APIRouter, BackgroundTasks, File, HTTPException, Request, Response, UploadFile
 from pydantic import BaseModel
 
 from app.services.resume_parser import (
@@ -13,8 +18,9 @@ from app.services.resume_parser import (
 )
 from app.services.resume_storage import (
     save_resume_data,
-    get_all_resumes,
+    get_all_resumes_metadata,
     get_resume_by_id,
+    get_resume_by_hash,
     get_latest_resume,
     delete_resume,
 )
@@ -34,6 +40,7 @@ from app.services.bullet_storage import (
     get_all_bullets,
     get_bullets_by_category,
     get_bullet_stats,
+    get_bullet_bank_version,
 )
 from app.services.answer_library import (
     AnswerGenerationError,
@@ -48,18 +55,43 @@ from app.services.proof_pack import (
     ProofPackError,
     build_proof_pack_from_profile,
     save_proof_pack,
-    save_proof_pack,
     get_latest_proof_pack,
+    get_proof_pack_version,
 )
 from app.services.data_store import (
     save_student_profile,
     load_student_profile,
+    get_student_profile_version,
 )
 from app.logging_config import get_logger
+from app.responses import ORJSONResponse, make_etag, not_modified
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/v1/student", tags=["Student"])
+router = APIRouter(prefix="/v1/student", tags=["Student"], default_response_class=ORJSONResponse)
+
+# Static metadata payloads, rendered to JSON once at import
+_PROFILE_TEMPLATE_BODY = ORJSONResponse(get_empty_profile_template()).body
+_QUESTION_CATEGORIES_BODY = ORJSONResponse(get_question_categories()).body
+
+# Bytes read per chunk from an uploaded file
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+# PDF text extraction is CPU-bound, so it runs in worker processes instead
+# of blocking the event loop. The pool is capped so parallel uploads don't
+# just contend for the same cores and disk. Workers are spawned rather
+# than forked, as the server process already runs threads.
+PDF_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+_pdf_pool = ProcessPoolExecutor(
+    max_workers=PDF_PARSE_WORKERS,
+    mp_context=multiprocessing.get_context("spawn"),
+)
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the PDF extraction worker processes."""
+    _pdf_pool.shutdown(wait=False, cancel_futures=True)
 
 
 # ============================================================
@@ -115,7 +147,7 @@ class GenerateBulletsResponse(BaseModel):
     bullets: List[Dict[str, Any]]
     by_category: Dict[str, List[Dict[str, Any]]]
     total: int
-    saved: bool
+    save_scheduled: bool  # the save runs after the response is sent
     message: str
 
 
@@ -140,7 +172,7 @@ class GenerateAnswersResponse(BaseModel):
     """Response schema for generated answers."""
     answers: Dict[str, Dict[str, Any]]
     total: int
-    saved: bool
+    save_scheduled: bool  # the save runs after the response is sent
     message: str
 
 
@@ -208,29 +240,46 @@ async def upload_resume(file: UploadFile = File(...)):
         logger.warning(f"Unexpected content type: {file.content_type}")
     
     try:
-        # Read file content
-        file_content = await file.read()
+        # Read file content in chunks, stopping as soon as it exceeds the limit
+        buffer = bytearray()
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            buffer.extend(chunk)
+            if len(buffer) > MAX_FILE_SIZE:
+                raise HTTPException(
+                    status_code=400,
+                    detail="File size exceeds maximum allowed size (5MB)"
+                )
+        file_content = bytes(buffer)
         file_size = len(file_content)
         
-        # Check file size before processing
-        if file_size > MAX_FILE_SIZE:
-            size_mb = file_size / (1024 * 1024)
-            raise HTTPException(
-                status_code=400,
-                detail=f"File size ({size_mb:.2f}MB) exceeds maximum allowed size (5MB)"
-            )
-        
         if file_size == 0:
             raise HTTPException(status_code=400, detail="Uploaded file is empty")
         
-        # Extract text from PDF
-        extracted_text = extract_text_from_pdf(file_content)
+        # Identical re-uploads reuse the stored record instead of re-parsing
+        content_hash = hashlib.sha256(file_content).hexdigest()
+        existing = get_resume_by_hash(content_hash)
+        if existing:
+            logger.info("Resume already uploaded: %s", existing["id"])
+            return ResumeUploadResponse(
+                id=existing["id"],
+                filename=existing["filename"],
+                file_size=existing["file_size"],
+                text_preview=get_text_preview(existing["extracted_text"], max_length=500),
+                full_text_length=len(existing["extracted_text"]),
+                message="Resume was already uploaded; returning the existing record"
+            )
+        
+        # Extract text from PDF in a worker process
+        extracted_text = await asyncio.get_running_loop().run_in_executor(
+            _pdf_pool, extract_text_from_pdf, file_content
+        )
         
         # Save to database
         resume_record = save_resume_data(
             filename=file.filename,
             extracted_text=extracted_text,
             file_size=file_size,
+            content_hash=content_hash,
         )
         
         if not resume_record:
@@ -242,7 +291,7 @@ async def upload_resume(file: UploadFile = File(...)):
         # Generate preview
         text_preview = get_text_preview(extracted_text, max_length=500)
         
-        logger.info(f"Resume uploaded successfully: {file.filename}")
+        logger.info("Resume uploaded successfully: %s", file.filename)
         
         return ResumeUploadResponse(
             id=resume_record["id"],
@@ -269,31 +318,19 @@ async def upload_resume(file: UploadFile = File(...)):
 
 
 @router.get("/resumes", response_model=ResumeListResponse)
-async def list_resumes():
+def list_resumes():
     """
     List all uploaded resumes.
     
     Returns a list of resume records with metadata (without full text).
     """
-    resumes = get_all_resumes()
-    
-    # Return metadata only (exclude full extracted_text for list view)
-    resume_list = [
-        {
-            "id": r["id"],
-            "filename": r["filename"],
-            "file_size": r["file_size"],
-            "created_at": r["created_at"],
-            "text_preview": get_text_preview(r.get("extracted_text", ""), 200),
-        }
-        for r in resumes
-    ]
+    resume_list = get_all_resumes_metadata(preview_chars=200)
     
     return ResumeListResponse(resumes=resume_list, total=len(resume_list))
 
 
 @router.get("/resumes/{resume_id}", response_model=ResumeDataResponse)
-async def get_resume(resume_id: str):
+def get_resume(resume_id: str):
     """
     Get a specific resume by ID.
     
@@ -308,7 +345,7 @@ async def get_resume(resume_id: str):
 
 
 @router.get("/resumes/latest", response_model=Optional[ResumeDataResponse])
-async def get_latest():
+def get_latest():
     """
     Get the most recently uploaded resume.
     """
@@ -321,14 +358,16 @@ async def get_latest():
 
 
 @router.delete("/resumes/{resume_id}", status_code=204)
-async def remove_resume(resume_id: str):
+def remove_resume(resume_id: str):
     """
     Delete a resume by ID.
     """
-    if not get_resume_by_id(resume_id):
+    deleted = delete_resume(resume_id)
+    
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Resume not found")
     
-    if not delete_resume(resume_id):
+    if not deleted:
         raise HTTPException(status_code=500, detail="Failed to delete resume")
     
     return None
@@ -384,7 +423,7 @@ async def extract_profile(request: ExtractProfileRequest):
         # Save profile to data store
         save_student_profile(extracted_profile)
         
-        logger.info(f"Profile extracted successfully from {source}")
+        logger.info("Profile extracted successfully from %s", source)
         
         return ExtractProfileResponse(
             profile=extracted_profile,
@@ -404,26 +443,37 @@ async def extract_profile(request: ExtractProfileRequest):
         )
 
 
-@router.get("/profile-template")
+@router.get("/profile-template", response_model=None)
 async def get_profile_template():
     """
     Get an empty profile template for manual editing.
     
     Returns the expected structure for student profile data.
     """
-    return get_empty_profile_template()
+    return Response(_PROFILE_TEMPLATE_BODY, media_type="application/json")
 
 
-@router.get("/profile", response_model=Optional[Dict[str, Any]])
-async def get_profile():
+@router.get("/profile", response_model=None)
+def get_profile(request: Request):
     """
     Get the currently stored student profile.
+    
+    Responses carry an ETag so an unchanged profile is answered with 304.
     """
-    return load_student_profile()
+    etag = make_etag(*get_student_profile_version())
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    
+    return ORJSONResponse(load_student_profile(), headers={"ETag": etag})
 
 
-@router.post("/generate-bullets", response_model=GenerateBulletsResponse)
-async def generate_bullets(request: GenerateBulletsRequest):
+@router.post(
+    "/generate-bullets",
+    response_model=None,
+    responses={200: {"model": GenerateBulletsResponse}},
+)
+async def generate_bullets(request: GenerateBulletsRequest, background_tasks: BackgroundTasks):
     """
     Generate achievement bullets from student profile data using LLM.
     
@@ -434,7 +484,7 @@ async def generate_bullets(request: GenerateBulletsRequest):
     - Bullets are grounded to specific projects/experiences
     - Each bullet is categorized (backend, frontend, ML, leadership, etc.)
     - Validation flags for ungrounded bullets
-    - Optional storage in bullet bank
+    - Optional storage in bullet bank (written after the response is sent)
     
     Returns categorized bullet list with source references.
     """
@@ -463,20 +513,23 @@ async def generate_bullets(request: GenerateBulletsRequest):
         # Group by category
         by_category = group_bullets_by_category(bullets)
         
-        # Save to bullet bank if requested
-        saved = False
+        # The response body is rendered before background tasks run, so the
+        # save can't leak its saved_at stamps into it
+        response = ORJSONResponse({
+            "bullets": bullets,
+            "by_category": by_category,
+            "total": len(bullets),
+            "save_scheduled": request.save_to_bank,
+            "message": f"Generated {len(bullets)} achievement bullets. Review for accuracy.",
+        })
+        
+        # Save to bullet bank after the response is sent
         if request.save_to_bank:
-            saved = save_bullets(bullets)
+            background_tasks.add_task(save_bullets, bullets)
         
-        logger.info(f"Generated {len(bullets)} bullets, saved={saved}")
+        logger.info("Generated %d bullets, save_to_bank=%s", len(bullets), request.save_to_bank)
         
-        return GenerateBulletsResponse(
-            bullets=bullets,
-            by_category=by_category,
-            total=len(bullets),
-            saved=saved,
-            message=f"Generated {len(bullets)} achievement bullets. Review for accuracy."
-        )
+        return response
         
     except BulletGenerationError as e:
         logger.error(f"Bullet generation error: {e}")
@@ -490,20 +543,26 @@ async def generate_bullets(request: GenerateBulletsRequest):
         )
 
 
-@router.get("/bullets", response_model=List[Dict[str, Any]])
-async def list_bullets(category: Optional[str] = None):
+@router.get("/bullets", response_model=None)
+def list_bullets(request: Request, category: Optional[str] = None):
     """
     List all bullets from the bullet bank.
     
-    Optionally filter by category.
+    Optionally filter by category. Responses carry an ETag so an unchanged
+    bullet bank is answered with 304.
     """
+    etag = make_etag(*get_bullet_bank_version())
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    
     if category:
-        return get_bullets_by_category(category)
-    return get_all_bullets()
+        return ORJSONResponse(get_bullets_by_category(category), headers={"ETag": etag})
+    return ORJSONResponse(get_all_bullets(), headers={"ETag": etag})
 
 
 @router.get("/bullets/stats", response_model=BulletStatsResponse)
-async def bullet_stats():
+def bullet_stats():
     """
     Get statistics about the bullet bank.
     """
@@ -511,8 +570,12 @@ async def bullet_stats():
     return BulletStatsResponse(**stats)
 
 
-@router.post("/generate-answers", response_model=GenerateAnswersResponse)
-async def generate_answers_endpoint(request: GenerateAnswersRequest):
+@router.post(
+    "/generate-answers",
+    response_model=None,
+    responses={200: {"model": GenerateAnswersResponse}},
+)
+async def generate_answers_endpoint(request: GenerateAnswersRequest, background_tasks: BackgroundTasks):
     """
     Generate answers for common job application questions using LLM.
     
@@ -524,7 +587,8 @@ async def generate_answers_endpoint(request: GenerateAnswersRequest):
     - Salary expectations
     - Why this company/role (template)
     
-    Answers are editable and stored in the answer library.
+    Answers are editable and stored in the answer library. The library is
+    written after the response is sent.
     """
     profile_data = request.profile_data
     
@@ -539,19 +603,20 @@ async def generate_answers_endpoint(request: GenerateAnswersRequest):
             categories=request.categories,
         )
         
-        # Save to library if requested
-        saved = False
+        response = ORJSONResponse({
+            "answers": answers,
+            "total": len(answers),
+            "save_scheduled": request.save_to_library,
+            "message": f"Generated {len(answers)} answers. Review and edit as needed.",
+        })
+        
+        # Save to library after the response is sent
         if request.save_to_library:
-            saved = save_answers(answers)
+            background_tasks.add_task(save_answers, answers)
         
-        logger.info(f"Generated {len(answers)} answers, saved={saved}")
+        logger.info("Generated %d answers, save_to_library=%s", len(answers), request.save_to_library)
         
-        return GenerateAnswersResponse(
-            answers=answers,
-            total=len(answers),
-            saved=saved,
-            message=f"Generated {len(answers)} answers. Review and edit as needed."
-        )
+        return response
         
     except AnswerGenerationError as e:
         logger.error(f"Answer generation error: {e}")
@@ -565,24 +630,24 @@ async def generate_answers_endpoint(request: GenerateAnswersRequest):
         )
 
 
-@router.get("/answers")
-async def list_answers():
+@router.get("/answers", response_model=None)
+def list_answers():
     """
     List all answers from the answer library.
     """
-    return get_all_answers()
+    return ORJSONResponse(get_all_answers())
 
 
-@router.get("/answers/categories")
+@router.get("/answers/categories", response_model=None)
 async def list_answer_categories():
     """
     Get all available question categories with their variants.
     """
-    return get_question_categories()
+    return Response(_QUESTION_CATEGORIES_BODY, media_type="application/json")
 
 
 @router.patch("/answers/{answer_id}")
-async def edit_answer(answer_id: str, request: UpdateAnswerRequest):
+def edit_answer(answer_id: str, request: UpdateAnswerRequest):
     """
     Update an answer's text.
     
@@ -597,7 +662,7 @@ async def edit_answer(answer_id: str, request: UpdateAnswerRequest):
 
 
 @router.get("/answers/{answer_id}")
-async def get_answer(answer_id: str):
+def get_answer(answer_id: str):
     """
     Get a specific answer by ID.
     """
@@ -609,7 +674,11 @@ async def get_answer(answer_id: str):
     return answer
 
 
-@router.post("/build-proof-pack", response_model=ProofPackResponse)
+@router.post(
+    "/build-proof-pack",
+    response_model=None,
+    responses={200: {"model": ProofPackResponse}},
+)
 async def build_proof_pack(request: BuildProofPackRequest):
     """
     Extract and organize key links/artifacts from a student's profile.
@@ -631,14 +700,16 @@ async def build_proof_pack(request: BuildProofPackRequest):
         if request.save_to_pack:
             saved = save_proof_pack(items)
             
-        logger.info(f"Built Proof Pack with {len(items)} items, saved={saved}")
+        logger.info("Built Proof Pack with %d items, saved=%s", len(items), saved)
         
-        return ProofPackResponse(
-            items=items,
-            total=len(items),
-            saved=saved,
-            message=f"Success: Collected {len(items)} proof artifacts from profile."
-        )
+        # build_proof_pack_from_profile already shapes every item to the
+        # ProofItem fields, so encode the dicts without building models
+        return ORJSONResponse({
+            "items": items,
+            "total": len(items),
+            "saved": saved,
+            "message": f"Success: Collected {len(items)} proof artifacts from profile.",
+        })
         
     except ProofPackError as e:
         logger.error(f"Proof Pack error: {e}")
@@ -647,9 +718,16 @@ async def build_proof_pack(request: BuildProofPackRequest):
         logger.error(f"Unexpected error building proof pack: {e}")
         raise HTTPException(status_code=500, detail="Internal server error while building proof pack")
 
-@router.get("/proof-pack", response_model=Optional[Dict[str, Any]])
-async def get_latest_pack():
+@router.get("/proof-pack", response_model=None)
+def get_latest_pack(request: Request):
     """
     Get the most recently built proof pack.
+    
+    Responses carry an ETag so an unchanged proof pack is answered with 304.
     """
-    return get_latest_proof_pack()
+    etag = make_etag(*get_proof_pack_version())
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    
+    return ORJSONResponse(get_latest_proof_pack(), headers={"ETag": etag})
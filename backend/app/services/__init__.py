@@ -4,19 +4,27 @@ from app.services.data_store import (
     # Student Profile
     save_student_profile,
     load_student_profile,
+    get_student_profile_version,
     # Jobs
     save_jobs,
     add_job,
+    add_jobs,
     load_jobs,
     get_job_by_id,
+    query_jobs,
+    update_job,
+    toggle_job_favorite,
     delete_job,
+    get_jobs_version,
     # Applications
     save_application,
     update_application,
     load_applications,
     get_application_by_id,
     get_applications_by_status,
+    query_applications,
     delete_application,
+    get_applications_version,
     # Statistics
     get_application_stats,
 )
@@ -25,19 +33,27 @@ __all__ = [
     # Student Profile
     "save_student_profile",
     "load_student_profile",
+    "get_student_profile_version",
     # Jobs
     "save_jobs",
     "add_job",
+    "add_jobs",
     "load_jobs",
     "get_job_by_id",
+    "query_jobs",
+    "update_job",
+    "toggle_job_favorite",
     "delete_job",
+    "get_jobs_version",
     # Applications
     "save_application",
     "update_application",
     "load_applications",
     "get_application_by_id",
     "get_applications_by_status",
+    "query_applications",
     "delete_application",
+    "get_applications_version",
     # Statistics
     "get_application_stats",
 ]
@@ -5,15 +5,21 @@ Generates reusable answers for common job application questions.
 Uses student profile data and constraints to create personalized responses.
 """
 
+import hashlib
 import json
-import re
+import os
 import threading
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from app.services.llm_client import generate_json, LLMClientError
+import orjson
+
+from app.services.llm_client import generate_json, strip_json_fences, LLMClientError
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -25,6 +31,23 @@ ANSWER_LIBRARY_FILE = DATA_DIR / "answer_library.json"
 # Thread lock for concurrent access
 _answers_lock = threading.RLock()
 
+# (library file mtime in ns when read or written, library data). Writes go
+# straight to disk and then replace the cache, so reads skip the file
+# unless another process changed it.
+_library_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+# Lookup indexes over the cached library's answers (first match wins)
+_answers_by_id: Dict[str, Dict[str, Any]] = {}
+_answers_by_category: Dict[str, Dict[str, Any]] = {}
+
+# LLM answers are reused for an identical prompt (same profile, constraints
+# and questions) within this many seconds
+ANSWER_CACHE_TTL = 24 * 60 * 60
+ANSWER_CACHE_MAX_ENTRIES = 128
+
+_answer_cache_lock = threading.Lock()
+# prompt hash -> (time.monotonic() when generated, raw answers by category); oldest first
+_answer_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
 # Standard question categories
 QUESTION_CATEGORIES = {
     "work_authorization": {
@@ -83,10 +106,29 @@ QUESTION_CATEGORIES = {
     },
 }
 
-# Answer generation prompt
+# Category names in their standard order, used when none are requested
+_ALL_CATEGORIES: Tuple[str, ...] = tuple(QUESTION_CATEGORIES)
+
+
+@lru_cache(maxsize=64)
+def _questions_text(categories: Tuple[str, ...]) -> str:
+    """Render the prompt's question list for the given categories, in order."""
+    return "\n".join(
+        f"- {cat}: {QUESTION_CATEGORIES[cat]['question']}"
+        for cat in categories
+        if cat in QUESTION_CATEGORIES
+    )
+
+
+# Question list for the common all-categories request
+_ALL_QUESTIONS_TEXT = _questions_text(_ALL_CATEGORIES)
+
+# Answer generation prompt. The fixed instructions come first and the
+# per-request data last, so repeated calls share the longest possible
+# prompt prefix for the provider's prompt caching.
 ANSWER_GENERATION_PROMPT = """You are a career advisor helping a job applicant prepare answers for common application questions.
 
-Generate professional, concise answers for the following questions based on the student's profile data.
+Generate professional, concise answers for the questions below based on the student's profile data.
 
 RULES:
 1. Use ONLY information from the provided profile - do NOT invent facts
@@ -95,19 +137,19 @@ RULES:
 4. If information is not available, provide a generic professional template that can be edited
 5. Mark answers that need editing/personalization with "[EDIT]" prefix
 
-Profile Data:
-{profile_data}
-
-Additional Constraints (if provided):
-{constraints}
-
-Generate answers for these questions:
-{questions}
-
 Return a JSON object with question category as key and answer as value:
 {{
   "category_name": "The answer text"
 }}
+
+Generate answers for these questions:
+{questions}
+
+Additional Constraints (if provided):
+{constraints}
+
+Profile Data:
+{profile_data}
 """
 
 
@@ -116,35 +158,137 @@ class AnswerGenerationError(Exception):
     pass
 
 
+# Set once the data directory is known to exist
+_dir_ready = False
+
 def _ensure_data_dir() -> None:
-    """Ensure the data directory exists."""
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    """Ensure the data directory exists; only the first call touches the filesystem."""
+    global _dir_ready
+    if not _dir_ready:
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        _dir_ready = True
 
 
-def _read_answer_library() -> Dict[str, Any]:
-    """Read the answer library JSON file."""
+def _library_mtime() -> int:
     try:
-        if ANSWER_LIBRARY_FILE.exists():
-            with open(ANSWER_LIBRARY_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return {"answers": []}
-    except Exception as e:
-        logger.error(f"Error reading answer library: {e}")
-        return {"answers": []}
+        return ANSWER_LIBRARY_FILE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _set_library_cache(mtime: int, data: Dict[str, Any]) -> None:
+    """Cache the answer library and rebuild its lookup indexes."""
+    global _library_cache, _answers_by_id, _answers_by_category
+    by_id: Dict[str, Dict[str, Any]] = {}
+    by_category: Dict[str, Dict[str, Any]] = {}
+    for answer in data.get("answers", []):
+        by_id.setdefault(answer.get("id"), answer)
+        by_category.setdefault(answer.get("category"), answer)
+    _library_cache = (mtime, data)
+    _answers_by_id = by_id
+    _answers_by_category = by_category
+
+
+def _load_answer_library() -> Dict[str, Any]:
+    """
+    Get the cached answer library, re-reading the file only if it changed.
+    
+    The returned data is shared and must not be modified.
+    """
+    with _answers_lock:
+        mtime = _library_mtime()
+        if _library_cache is None or _library_cache[0] != mtime:
+            try:
+                if ANSWER_LIBRARY_FILE.exists():
+                    with open(ANSWER_LIBRARY_FILE, "rb") as f:
+                        data = orjson.loads(f.read())
+                else:
+                    data = {"answers": []}
+            except Exception as e:
+                logger.error(f"Error reading answer library: {e}")
+                data = {"answers": []}
+            _set_library_cache(mtime, data)
+        return _library_cache[1]
+
+
+def _read_answer_library() -> Dict[str, Any]:
+    """
+    Read the answer library, from memory unless the file changed since last read.
+    
+    Returns copies of the answer dicts, so callers may modify them.
+    """
+    with _answers_lock:
+        data = _load_answer_library()
+        return {**data, "answers": [dict(a) for a in data.get("answers", [])]}
 
 
 def _write_answer_library(data: Dict[str, Any]) -> bool:
-    """Write to the answer library JSON file."""
-    try:
-        _ensure_data_dir()
-        temp_path = ANSWER_LIBRARY_FILE.with_suffix(".tmp")
-        with open(temp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
-        temp_path.replace(ANSWER_LIBRARY_FILE)
+    """
+    Write the answer library to disk and cache it. Returns False if the write failed.
+    
+    The cache keeps the previous library if the write fails.
+    """
+    with _answers_lock:
+        try:
+            _ensure_data_dir()
+            temp_path = ANSWER_LIBRARY_FILE.with_suffix(".tmp")
+            with open(temp_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=str))
+                f.flush()
+                os.fsync(f.fileno())
+            temp_path.replace(ANSWER_LIBRARY_FILE)
+        except Exception as e:
+            logger.error(f"Error writing answer library: {e}")
+            return False
+        _set_library_cache(_library_mtime(), data)
         return True
-    except Exception as e:
-        logger.error(f"Error writing answer library: {e}")
-        return False
+
+
+def _generate_raw_answers(prompt: str) -> Dict[str, Any]:
+    """
+    Get the LLM's answers by category for a prompt, reusing recent results.
+    
+    Only successfully parsed, non-empty answers are cached, so a bad LLM
+    response is retried on the next call.
+    """
+    key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    now = time.monotonic()
+    
+    with _answer_cache_lock:
+        hit = _answer_cache.get(key)
+        if hit is not None and now - hit[0] < ANSWER_CACHE_TTL:
+            _answer_cache.move_to_end(key)
+            return hit[1]
+    
+    # Call Gemini API via llm_client
+    response_text = generate_json(
+        prompt=prompt,
+        system_prompt="You are a career advisor. Generate professional, factual answers. Return only valid JSON.",
+        temperature=0.3
+    )
+    
+    # Extract JSON from response
+    response_text = strip_json_fences(response_text)
+    
+    try:
+        raw_answers = json.loads(response_text)
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse LLM response: {e}")
+        return {}
+        
+    # Ensure raw_answers is a dict
+    if not isinstance(raw_answers, dict):
+        logger.warning(f"Expected dict for answers, got {type(raw_answers)}")
+        return {}
+    
+    if raw_answers:
+        with _answer_cache_lock:
+            _answer_cache[key] = (now, raw_answers)
+            _answer_cache.move_to_end(key)
+            while len(_answer_cache) > ANSWER_CACHE_MAX_ENTRIES:
+                _answer_cache.popitem(last=False)
+    
+    return raw_answers
 
 
 def generate_answers(
@@ -168,14 +312,10 @@ def generate_answers(
     """
     # Default to all categories if not specified
     if not categories:
-        categories = list(QUESTION_CATEGORIES.keys())
-    
-    # Build questions list for prompt
-    questions_text = "\n".join([
-        f"- {cat}: {QUESTION_CATEGORIES[cat]['question']}"
-        for cat in categories
-        if cat in QUESTION_CATEGORIES
-    ])
+        categories = _ALL_CATEGORIES
+        questions_text = _ALL_QUESTIONS_TEXT
+    else:
+        questions_text = _questions_text(tuple(categories))
     
     # Prepare profile data (exclude validation metadata)
     profile_for_prompt = {
@@ -183,42 +323,23 @@ def generate_answers(
         if not k.startswith("_")
     }
     
-    # Build constraints text
+    # Build constraints text. Prompt data is sent as compact JSON; indentation
+    # only adds whitespace tokens the model doesn't need.
     constraints_text = "None provided"
     if constraints:
-        constraints_text = json.dumps(constraints, indent=2)
+        constraints_text = orjson.dumps(constraints).decode()
     
     try:
         prompt = ANSWER_GENERATION_PROMPT.format(
-            profile_data=json.dumps(profile_for_prompt, indent=2),
+            profile_data=orjson.dumps(profile_for_prompt).decode(),
             constraints=constraints_text,
             questions=questions_text,
         )
         
-        # Call Gemini API via llm_client
-        response_text = generate_json(
-            prompt=prompt,
-            system_prompt="You are a career advisor. Generate professional, factual answers. Return only valid JSON.",
-            temperature=0.3
-        )
-        
-        # Extract JSON from response
-        json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', response_text)
-        if json_match:
-            response_text = json_match.group(1)
-        
-        try:
-            raw_answers = json.loads(response_text)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response: {e}")
-            raw_answers = {}
-            
-        # Ensure raw_answers is a dict
-        if not isinstance(raw_answers, dict):
-            logger.warning(f"Expected dict for answers, got {type(raw_answers)}")
-            raw_answers = {}
+        raw_answers = _generate_raw_answers(prompt)
         
-        # Process and enrich answers
+        # Process and enrich answers, all stamped with the same time
+        now = datetime.utcnow().isoformat()
         processed_answers = {}
         for category in categories:
             if category not in QUESTION_CATEGORIES:
@@ -238,8 +359,8 @@ def generate_answers(
                 "answer": answer_text,
                 "needs_editing": needs_editing,
                 "is_template": "[COMPANY_NAME]" in answer_text or "[ROLE]" in answer_text,
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat(),
+                "created_at": now,
+                "updated_at": now,
             }
         
         logger.info(f"Generated {len(processed_answers)} answers")
@@ -266,6 +387,7 @@ def save_answers(answers: Dict[str, Dict[str, Any]]) -> bool:
     """
     with _answers_lock:
         data = _read_answer_library()
+        now = datetime.utcnow().isoformat()
         
         # Convert dict to list and add/update
         for category, answer_data in answers.items():
@@ -278,7 +400,7 @@ def save_answers(answers: Dict[str, Dict[str, Any]]) -> bool:
             
             if existing_idx is not None:
                 # Update existing
-                answer_data["updated_at"] = datetime.utcnow().isoformat()
+                answer_data["updated_at"] = now
                 data["answers"][existing_idx] = answer_data
             else:
                 # Add new
@@ -300,21 +422,17 @@ def get_all_answers() -> List[Dict[str, Any]]:
 def get_answer_by_category(category: str) -> Optional[Dict[str, Any]]:
     """Get an answer by category."""
     with _answers_lock:
-        data = _read_answer_library()
-        for answer in data.get("answers", []):
-            if answer.get("category") == category:
-                return answer
-        return None
+        _load_answer_library()
+        answer = _answers_by_category.get(category)
+        return dict(answer) if answer is not None else None
 
 
 def get_answer_by_id(answer_id: str) -> Optional[Dict[str, Any]]:
     """Get an answer by ID."""
     with _answers_lock:
-        data = _read_answer_library()
-        for answer in data.get("answers", []):
-            if answer.get("id") == answer_id:
-                return answer
-        return None
+        _load_answer_library()
+        answer = _answers_by_id.get(answer_id)
+        return dict(answer) if answer is not None else None
 
 
 def update_answer(answer_id: str, new_answer_text: str) -> Optional[Dict[str, Any]]:
@@ -10,10 +10,12 @@ Orchestrates the creation of a complete application package including:
 
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 import traceback
 
+from app.config import settings
 from app.logging_config import get_logger
 from app.services.data_store import (
     get_job_by_id, 
@@ -30,6 +32,17 @@ from app.services.audit_log import log_audit_event
 
 logger = get_logger(__name__)
 
+# Runs the independent artifact generators of every assembly. Each of them
+# makes LLM calls, which llm_client caps at llm_max_concurrency, so more
+# threads than that would only wait.
+_generation_pool = ThreadPoolExecutor(
+    max_workers=settings.llm_max_concurrency, thread_name_prefix="assemble"
+)
+
+def shutdown_generation_pool() -> None:
+    """Stop the artifact generation threads."""
+    _generation_pool.shutdown(wait=False, cancel_futures=True)
+
 class AssemblerError(Exception):
     """Base exception for application assembly errors."""
     pass
@@ -54,28 +67,39 @@ def assemble_application_package(job_id: str, profile_data: Optional[Dict[str, A
 
         logger.info(f"Assembling application for {job.get('title')} at {job.get('company')}")
 
-        # 2. Generate Components (sequentially for now, could be async)
-        
-        # Resume
-        logger.info("Tailoring resume...")
-        resume = tailor_resume(job_id, profile_data)
-        log_audit_event(job_id, "generation", {"type": "resume", "content": resume}, "Resume Tailored")
-        
-        # Cover Letter
-        logger.info("Generating cover letter...")
-        cl_result = generate_cover_letter(job_id, profile_data)
-        cover_letter_text = cl_result.get("cover_letter_text", "")
-        log_audit_event(job_id, "generation", {"type": "cover_letter", "content": cl_result}, "Cover Letter Generated")
-        
-        # Evidence Map
-        logger.info("Mapping evidence...")
-        evidence_map = map_evidence(job_id, profile_data)
-        log_audit_event(job_id, "generation", {"type": "evidence", "content": evidence_map}, "Evidence Mapped")
-        
-        # Answers (Standard Questions)
-        logger.info("Generating answers...")
-        # Get answers for standard categories
-        answers_map = generate_answers(profile_data)
+        # 2. Generate Components
+        # The four generators are independent LLM calls, so run them
+        # concurrently; llm_client caps how many requests are in flight.
+        # Results are collected in order to keep the audit trail ordered.
+        logger.info("Generating resume, cover letter, evidence map and answers...")
+        futures = []
+        try:
+            resume_future = _generation_pool.submit(tailor_resume, job_id, profile_data)
+            cl_future = _generation_pool.submit(generate_cover_letter, job_id, profile_data)
+            evidence_future = _generation_pool.submit(map_evidence, job_id, profile_data)
+            # Get answers for standard categories
+            answers_future = _generation_pool.submit(generate_answers, profile_data)
+            futures = [resume_future, cl_future, evidence_future, answers_future]
+            
+            # Resume
+            resume = resume_future.result()
+            log_audit_event(job_id, "generation", {"type": "resume", "content": resume}, "Resume Tailored")
+            
+            # Cover Letter
+            cl_result = cl_future.result()
+            cover_letter_text = cl_result.get("cover_letter_text", "")
+            log_audit_event(job_id, "generation", {"type": "cover_letter", "content": cl_result}, "Cover Letter Generated")
+            
+            # Evidence Map
+            evidence_map = evidence_future.result()
+            log_audit_event(job_id, "generation", {"type": "evidence", "content": evidence_map}, "Evidence Mapped")
+            
+            # Answers (Standard Questions)
+            answers_map = answers_future.result()
+        finally:
+            # Don't leave queued calls behind if one of them failed
+            for future in futures:
+                future.cancel()
         
         # 3. Construct Package
         package_id = str(uuid.uuid4())
@@ -95,7 +119,7 @@ def assemble_application_package(job_id: str, profile_data: Optional[Dict[str, A
                 "name": profile_data.get("personal_info", {}).get("name") or profile_data.get("name"),
                 "email": profile_data.get("personal_info", {}).get("email") or profile_data.get("email"),
                 "phone": profile_data.get("personal_info", {}).get("phone") or profile_data.get("phone"),
-                "linkedin": profile_data.get("links", {}).get("linkedin")
+                "linkedin": profile_data.get("links", {}).get("linkedin") or profile_data.get("linkedin_url")
             },
             "status": "ready_to_submit"
         }
@@ -124,8 +148,8 @@ def assemble_application_package(job_id: str, profile_data: Optional[Dict[str, A
         # But data_store saves what is passed usually if it just dumps JSON.
         # Let's return the package regardless.
         
-        app_id = save_application(app_data)
-        package["application_id"] = app_id
+        saved_app = save_application(app_data)
+        package["application_id"] = saved_app["id"] if saved_app else None
         
         logger.info(f"Assembly complete. Package ID: {package_id}")
         return package
@@ -9,15 +9,18 @@ Controls:
 - Global kill switch (Pause All)
 """
 
-import json
+import os
 import threading
 from datetime import datetime, date
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import traceback
 
+import orjson
+
 from app.logging_config import get_logger
 from app.services.data_store import (
+    get_applications_version,
     load_applications, 
     get_job_by_id, 
     load_student_profile
@@ -29,9 +32,19 @@ logger = get_logger(__name__)
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 POLICY_FILE = DATA_DIR / "apply_policy.json"
 
-# Thread lock
+# Serializes writers and policy reloads. Readers don't take it: they read
+# the current snapshot tuple, which writers replace in a single assignment
+# and never modify in place.
 _policy_lock = threading.RLock()
 
+# (policy file mtime in ns when read or written, policy, checker compiled
+# from the policy: job_id -> (allowed, reason)). Writes go straight to disk
+# and then replace the snapshot, so reads skip the file unless another
+# process changed it.
+_policy_cache: Optional[Tuple[int, Dict[str, Any], Callable[[str], Tuple[bool, str]]]] = None
+# (UTC date, applications data version, applications made that day)
+_today_count: Optional[Tuple[str, Tuple[int, int], int]] = None
+
 # Defaults
 DEFAULT_POLICY = {
     "daily_limit": 0,
@@ -46,41 +59,163 @@ class PolicyError(Exception):
     """Base exception for policy errors."""
     pass
 
+# Set once the data directory is known to exist, so writes skip the mkdir
+_dir_ready = False
+
 def _ensure_data_dir() -> None:
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    global _dir_ready
+    if not _dir_ready:
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        _dir_ready = True
 
-def _read_policy() -> Dict[str, Any]:
-    """Read the policy file safely."""
+def _policy_mtime() -> int:
     try:
-        if POLICY_FILE.exists():
-            with open(POLICY_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                # Merge with defaults for missing keys
-                return {**DEFAULT_POLICY, **data}
-        return DEFAULT_POLICY.copy()
-    except Exception as e:
-        logger.error(f"Error reading apply policy: {e}")
-        return DEFAULT_POLICY.copy()
+        return POLICY_FILE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+def _compile_policy(policy: Dict[str, Any]) -> Callable[[str], Tuple[bool, str]]:
+    """
+    Build a job checker specialized to one policy.
+    
+    Settings are read and normalized once here instead of on every check,
+    and checks the policy disables are left out entirely.
+    """
+    paused = bool(policy.get("paused"))
+    blocked = tuple(dict.fromkeys(c.lower() for c in policy.get("blocked_companies", [])))
+    exact = frozenset(blocked)
+    min_score = policy.get("min_match_score", 0)
+    remote_only = bool(policy.get("remote_only_enforced"))
+    limit = policy.get("daily_limit", 10)
+    # 0 or None means infinite/no limit
+    has_limit = limit is not None and limit > 0
+    
+    def check(job_id: str) -> Tuple[bool, str]:
+        # 1. Global Kill Switch
+        if paused:
+            return False, "Global policy PAUSED"
+        
+        # 2. Get Job
+        job = get_job_by_id(job_id)
+        if not job:
+            return False, "Job not found"
+        
+        # 3. Blocked Companies (exact match first, then substring match)
+        if blocked:
+            company = job.get("company", "").lower()
+            if company in exact or any(b in company for b in blocked):
+                return False, f"Company '{job.get('company')}' is in blocked list"
+        
+        # 4. Minimum Match Score
+        # Unscored jobs (manual or not yet ranked) pass this check
+        match_score = job.get("match_score")
+        if match_score is not None and match_score < min_score:
+            return False, f"Match score {match_score} below threshold {min_score}"
+        
+        # 5. Remote Only Enforcement
+        if remote_only:
+            is_remote = job.get("is_remote") or "remote" in job.get("location", "").lower() or "remote" in job.get("title", "").lower()
+            if not is_remote:
+                return False, "Job is not Remote (Policy Enforced)"
+        
+        # 6. Daily Limit
+        if has_limit:
+            day_count = _count_applications_on(datetime.utcnow().strftime("%Y-%m-%d"))
+            if day_count >= limit:
+                return False, f"Daily limit reached ({day_count}/{limit})"
+        
+        return True, "Policy checks passed"
+    
+    return check
+
+def _set_policy_cache(mtime: int, policy: Dict[str, Any]) -> None:
+    """Cache a policy along with the checker compiled from it."""
+    global _policy_cache
+    _policy_cache = (mtime, policy, _compile_policy(policy))
+
+def _policy_snapshot() -> Tuple[int, Dict[str, Any], Callable[[str], Tuple[bool, str]]]:
+    """
+    Get the current policy snapshot, reloading it if the file changed.
+    
+    The snapshot and the policy in it must not be modified.
+    """
+    snapshot = _policy_cache
+    if snapshot is not None and snapshot[0] == _policy_mtime():
+        return snapshot
+    with _policy_lock:
+        mtime = _policy_mtime()
+        if _policy_cache is None or _policy_cache[0] != mtime:
+            try:
+                if POLICY_FILE.exists():
+                    with open(POLICY_FILE, "rb") as f:
+                        data = orjson.loads(f.read())
+                        # Merge with defaults for missing keys
+                        policy = {**DEFAULT_POLICY, **data}
+                else:
+                    policy = DEFAULT_POLICY.copy()
+            except Exception as e:
+                logger.error(f"Error reading apply policy: {e}")
+                policy = DEFAULT_POLICY.copy()
+            _set_policy_cache(mtime, policy)
+        return _policy_cache
+
+def _read_policy() -> Dict[str, Any]:
+    """
+    Read the policy, from memory unless the file changed since last read.
+    
+    Returns a copy the caller may modify.
+    """
+    return dict(_policy_snapshot()[1])
 
 def _write_policy(data: Dict[str, Any]) -> bool:
-    """Write to the policy file safely."""
-    try:
-        _ensure_data_dir()
-        temp_path = POLICY_FILE.with_suffix(".tmp")
-        with open(temp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
-        temp_path.replace(POLICY_FILE)
+    """
+    Write the policy to disk and cache it. Returns False if the write failed.
+    
+    The cached policy is left unchanged if the write fails.
+    """
+    with _policy_lock:
+        try:
+            _ensure_data_dir()
+            temp_path = POLICY_FILE.with_suffix(".tmp")
+            with open(temp_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=str))
+                f.flush()
+                os.fsync(f.fileno())
+            temp_path.replace(POLICY_FILE)
+        except Exception as e:
+            logger.error(f"Error writing apply policy: {e}")
+            return False
+        _set_policy_cache(_policy_mtime(), dict(data))
         return True
-    except Exception as e:
-        logger.error(f"Error writing apply policy: {e}")
-        return False
 
 # Public API
 
 def get_policy() -> Dict[str, Any]:
     """Get current application policy."""
-    with _policy_lock:
-        return _read_policy()
+    return _read_policy()
+
+def _count_applications_on(day_str: str) -> int:
+    """
+    Count applications applied or created on the given YYYY-MM-DD date.
+    
+    The count is reused until the date or the applications data changes,
+    so repeated policy checks don't re-read every application.
+    """
+    global _today_count
+    version = get_applications_version()
+    cached = _today_count
+    if cached is not None and cached[:2] == (day_str, version):
+        return cached[2]
+    
+    day_count = 0
+    for app in load_applications():
+        # Check applied_at or created_at
+        app_date = app.get("applied_at") or app.get("created_at")
+        if app_date and app_date.startswith(day_str):
+            day_count += 1
+    
+    _today_count = (day_str, version, day_count)
+    return day_count
 
 def set_policy(updates: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -128,83 +263,10 @@ def check_application_policy(job_id: str) -> Dict[str, Any]:
         - reason: str (if blocked)
         - policy_snapshot: dict
     """
-    policy = get_policy()
-    
-    # 1. Global Kill Switch
-    if policy.get("paused"):
-        return {
-            "allowed": False,
-            "reason": "Global policy PAUSED",
-            "policy_snapshot": policy
-        }
-
-    # 2. Get Job
-    job = get_job_by_id(job_id)
-    if not job:
-        return {
-            "allowed": False,
-            "reason": "Job not found",
-            "policy_snapshot": policy
-        }
-
-    # 3. Blocked Companies
-    company = job.get("company", "").lower()
-    blocked = [c.lower() for c in policy.get("blocked_companies", [])]
-    if any(b in company for b in blocked):
-        return {
-            "allowed": False,
-            "reason": f"Company '{job.get('company')}' is in blocked list",
-            "policy_snapshot": policy
-        }
-
-    # 4. Minimum Match Score (if score exists on job or needs calc)
-    # Assuming score might be in job metadata from ranking
-    # If not present, we assume strictly manual or unscored jobs pass this check 
-    # OR we could call ranking service here (expensive?)
-    # For now, check if 'match_score' is in job (it should be if queued by ranker)
-    match_score = job.get("match_score")
-    min_score = policy.get("min_match_score", 0)
-    
-    if match_score is not None and match_score < min_score:
-         return {
-            "allowed": False,
-            "reason": f"Match score {match_score} below threshold {min_score}",
-            "policy_snapshot": policy
-        }
-
-    # 5. Remote Only Enforcement
-    if policy.get("remote_only_enforced"):
-        is_remote = job.get("is_remote") or "remote" in job.get("location", "").lower() or "remote" in job.get("title", "").lower()
-        if not is_remote:
-             return {
-                "allowed": False,
-                "reason": "Job is not Remote (Policy Enforced)",
-                "policy_snapshot": policy
-            }
-
-    # 6. Daily Limit
-    # Count applications made today
-    applications = load_applications()
-    today_str = datetime.utcnow().strftime("%Y-%m-%d")
-    
-    day_count = 0
-    for app in applications:
-        # Check applied_at or created_at
-        app_date = app.get("applied_at") or app.get("created_at")
-        if app_date and app_date.startswith(today_str):
-            day_count += 1
-            
-    limit = policy.get("daily_limit", 10)
-    # 0 or None means infinite/no limit
-    if limit is not None and limit > 0 and day_count >= limit:
-        return {
-            "allowed": False,
-            "reason": f"Daily limit reached ({day_count}/{limit})",
-            "policy_snapshot": policy
-        }
-
+    _, policy, check = _policy_snapshot()
+    allowed, reason = check(job_id)
     return {
-        "allowed": True,
-        "reason": "Policy checks passed",
-        "policy_snapshot": policy
+        "allowed": allowed,
+        "reason": reason,
+        "policy_snapshot": dict(policy)
     }
@@ -6,47 +6,146 @@ Maintains a comprehensive audit trail of every automated action taken on behalf
 Logs data snapshots, AI generations, verification results, and submission attempts.
 """
 
-import json
+import asyncio
+import atexit
+import os
 import threading
-from datetime import datetime
+from collections import defaultdict
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
+import orjson
+
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
-AUDIT_FILE = DATA_DIR / "audit_logs.json"
+# One JSON event per line, appended as events happen
+AUDIT_FILE = DATA_DIR / "audit_logs.jsonl"
+# Former whole-file format (dict keyed by job id), migrated on first use
+LEGACY_AUDIT_FILE = DATA_DIR / "audit_logs.json"
 
 _audit_lock = threading.RLock()
 
-def _ensure_data_dir() -> None:
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+# Logged events are buffered and appended in one write, followed by a
+# single fsync, at most AUDIT_FLUSH_INTERVAL seconds after the first one
+AUDIT_FLUSH_INTERVAL = 0.05
+_pending_lines: List[bytes] = []
 
-def _read_logs() -> Dict[str, List[Dict[str, Any]]]:
-    """Reads logs, returns dict keyed by app_id."""
-    try:
-        if AUDIT_FILE.exists():
-            with open(AUDIT_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return {}
-    except Exception as e:
-        logger.error(f"Error reading audit logs: {e}")
-        return {}
+# Seconds between runs of the background audit log compaction
+AUDIT_COMPACT_INTERVAL = 24 * 60 * 60
+_audit_flush_timer: Optional[threading.Timer] = None
+
+# Index over the first `offset` bytes of AUDIT_FILE: the (start, length) byte
+# span of each event line by job id, and the same spans by (job id, event
+# type). Only spans are kept in memory; event bodies are read from the file
+# when a trail is requested.
+_trail_index: Dict[str, Any] = {
+    "offset": 0,
+    "trails": defaultdict(list),
+    "by_type": defaultdict(list),
+}
+
+# Set once the data directory is known to exist, so writes skip the mkdir
+_dir_ready = False
 
-def _write_logs(logs: Dict[str, List[Dict[str, Any]]]) -> bool:
+def _ensure_data_dir() -> None:
+    global _dir_ready
+    if not _dir_ready:
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        _dir_ready = True
+
+def _migrate_legacy_logs() -> None:
+    """Convert audit_logs.json to the JSON lines file, if it hasn't been yet."""
+    if AUDIT_FILE.exists() or not LEGACY_AUDIT_FILE.exists():
+        return
     try:
+        with open(LEGACY_AUDIT_FILE, "rb") as f:
+            logs = orjson.loads(f.read())
         _ensure_data_dir()
         temp_path = AUDIT_FILE.with_suffix(".tmp")
-        with open(temp_path, "w", encoding="utf-8") as f:
-            json.dump(logs, f, indent=2, default=str)
+        with open(temp_path, "wb") as f:
+            for job_id, trail in logs.items():
+                for entry in trail:
+                    f.write(orjson.dumps({"job_id": job_id, **entry}, default=str) + b"\n")
         temp_path.replace(AUDIT_FILE)
-        return True
+        LEGACY_AUDIT_FILE.unlink()
+        logger.info("Migrated audit logs to JSON lines format")
     except Exception as e:
-        logger.error(f"Error writing audit logs: {e}")
-        return False
+        logger.error(f"Error migrating audit logs: {e}")
+
+def _reset_index() -> None:
+    """Drop the in-memory index so the next sync re-reads the whole file."""
+    _trail_index["offset"] = 0
+    _trail_index["trails"] = defaultdict(list)
+    _trail_index["by_type"] = defaultdict(list)
+
+def _sync_index() -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Bring the in-memory index up to date with the audit file.
+    
+    Only bytes appended since the last sync are read. If the file shrank
+    (e.g. it was compacted), the index is rebuilt from the start.
+    """
+    _migrate_legacy_logs()
+    try:
+        size = AUDIT_FILE.stat().st_size
+    except OSError:
+        size = 0
+    
+    if size < _trail_index["offset"]:
+        _reset_index()
+    
+    if size > _trail_index["offset"]:
+        try:
+            with open(AUDIT_FILE, "rb") as f:
+                f.seek(_trail_index["offset"])
+                chunk = f.read(size - _trail_index["offset"])
+        except OSError as e:
+            logger.error(f"Error reading audit logs: {e}")
+            return _trail_index["trails"]
+        
+        # Leave a trailing partial line for the next sync
+        consumed = chunk.rfind(b"\n") + 1
+        base = _trail_index["offset"]
+        pos = 0
+        while pos < consumed:
+            end = chunk.index(b"\n", pos)
+            line = chunk[pos:end]
+            span = (base + pos, end - pos)
+            pos = end + 1
+            if not line.strip():
+                continue
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                logger.warning("Skipping malformed audit log line")
+                continue
+            job_id = entry.get("job_id", "")
+            _trail_index["trails"][job_id].append(span)
+            _trail_index["by_type"][(job_id, entry.get("event_type"))].append(span)
+        _trail_index["offset"] += consumed
+    
+    return _trail_index["trails"]
+
+def _read_events(spans: List[Tuple[int, int]]) -> List[Dict[str, Any]]:
+    """Load the events at the given byte spans of the audit file."""
+    if not spans:
+        return []
+    events = []
+    try:
+        with open(AUDIT_FILE, "rb") as f:
+            for start, length in spans:
+                f.seek(start)
+                entry = orjson.loads(f.read(length))
+                entry.pop("job_id", None)
+                events.append(entry)
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.error(f"Error reading audit logs: {e}")
+    return events
 
 def log_audit_event(
     job_id: str,
@@ -57,31 +156,148 @@ def log_audit_event(
     """
     Log a distinct event in the application process.
     
+    The event is appended as a single line, so logging costs the same
+    no matter how many events are already stored. Lines are buffered
+    briefly and written in batches by flush_audit_log().
+    
     Args:
         job_id: The Job ID this event relates to.
         event_type: Category (e.g., 'snapshot', 'generation', 'verification', 'policy', 'submission').
         details: arbitrary JSON data.
         step_name: Human readable step name (e.g. "Resume Verification").
     """
+    entry = {
+        "job_id": job_id,
+        "id": str(uuid4()),
+        "timestamp": datetime.utcnow().isoformat(),
+        "event_type": event_type,
+        "step": step_name,
+        "details": details
+    }
+    line = orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS, default=str) + b"\n"
+    
+    global _audit_flush_timer
     with _audit_lock:
-        logs = _read_logs()
-        
-        if job_id not in logs:
-            logs[job_id] = []
-            
-        entry = {
-            "id": str(uuid4()),
-            "timestamp": datetime.utcnow().isoformat(),
-            "event_type": event_type,
-            "step": step_name,
-            "details": details
-        }
-        
-        logs[job_id].append(entry)
-        _write_logs(logs)
+        _pending_lines.append(line)
+        if _audit_flush_timer is None:
+            _audit_flush_timer = threading.Timer(AUDIT_FLUSH_INTERVAL, flush_audit_log)
+            _audit_flush_timer.daemon = True
+            _audit_flush_timer.start()
 
-def get_audit_trail(job_id: str) -> List[Dict[str, Any]]:
-    """Retrieve the full audit trail for a job/application."""
+def flush_audit_log() -> bool:
+    """
+    Append buffered audit events to the audit file and fsync it.
+    
+    Returns False if the write failed; the events stay buffered for the
+    next flush.
+    """
+    global _audit_flush_timer
     with _audit_lock:
-        logs = _read_logs()
-        return logs.get(job_id, [])
+        _audit_flush_timer = None
+        if not _pending_lines:
+            return True
+        _migrate_legacy_logs()
+        try:
+            _ensure_data_dir()
+            with open(AUDIT_FILE, "ab") as f:
+                f.write(b"".join(_pending_lines))
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            logger.error(f"Error writing audit logs: {e}")
+            return False
+        _pending_lines.clear()
+        return True
+
+# Write any buffered events on interpreter exit
+atexit.register(flush_audit_log)
+
+def get_audit_trail(
+    job_id: str,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    event_type: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve the audit trail for a job/application, oldest event first.
+    
+    Only the requested events are read from disk, so memory use follows
+    the size of the page returned rather than the whole audit file.
+    
+    Args:
+        job_id: The Job ID to fetch events for.
+        limit: Maximum number of events to return (None for all).
+        offset: Number of events to skip.
+        event_type: Only return events of this type (e.g. 'generation').
+    """
+    with _audit_lock:
+        flush_audit_log()
+        trails = _sync_index()
+        if event_type is None:
+            trail = trails.get(job_id, [])
+        else:
+            trail = _trail_index["by_type"].get((job_id, event_type), [])
+        end = None if limit is None else offset + limit
+        return _read_events(trail[offset:end])
+
+def compact_audit_logs(max_age_days: int = 90) -> int:
+    """
+    Drop audit events older than max_age_days by rewriting the audit file.
+    
+    The file is streamed line by line and kept events are copied as is.
+    
+    Returns:
+        Number of events removed.
+    """
+    cutoff = (datetime.utcnow() - timedelta(days=max_age_days)).isoformat()
+    with _audit_lock:
+        flush_audit_log()
+        _migrate_legacy_logs()
+        if not AUDIT_FILE.exists():
+            return 0
+        kept = 0
+        removed = 0
+        try:
+            _ensure_data_dir()
+            temp_path = AUDIT_FILE.with_suffix(".tmp")
+            with open(AUDIT_FILE, "rb") as src, open(temp_path, "wb") as f:
+                for line in src:
+                    if not line.strip():
+                        continue
+                    try:
+                        timestamp = orjson.loads(line).get("timestamp", "")
+                    except orjson.JSONDecodeError:
+                        logger.warning("Dropping malformed audit log line")
+                        continue
+                    if timestamp < cutoff:
+                        removed += 1
+                        continue
+                    f.write(line if line.endswith(b"\n") else line + b"\n")
+                    kept += 1
+                if removed:
+                    f.flush()
+                    os.fsync(f.fileno())
+            if not removed:
+                # Nothing expired; keep the file (and the index over it) as is
+                temp_path.unlink()
+                return 0
+            temp_path.replace(AUDIT_FILE)
+        except Exception as e:
+            logger.error(f"Error compacting audit logs: {e}")
+            return 0
+        
+        # Rebuild the index from the rewritten file on next read
+        _reset_index()
+        logger.info(f"Compacted audit logs: kept {kept}, removed {removed}")
+        return removed
+
+async def run_audit_compactor(max_age_days: int, interval: float = AUDIT_COMPACT_INTERVAL) -> None:
+    """
+    Compact the audit logs now and then every interval seconds until cancelled.
+    
+    Keeps the append-only file from growing without bound on long-running
+    servers. Compaction runs in a worker thread.
+    """
+    while True:
+        await asyncio.to_thread(compact_audit_logs, max_age_days)
+        await asyncio.sleep(interval)
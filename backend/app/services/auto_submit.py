@@ -9,19 +9,19 @@ Includes:
 """
 
 import asyncio
-import json
+import contextlib
 import httpx
 from datetime import datetime
-from typing import Any, Dict, Optional
-import traceback
+from typing import Any, Dict, List, Optional
 import random
+import threading
+import time
 
 from app.config import settings
 from app.logging_config import get_logger
 from app.services.data_store import (
     load_applications, 
-    update_application,
-    get_job_by_id
+    update_application
 )
 
 logger = get_logger(__name__)
@@ -29,12 +29,144 @@ logger = get_logger(__name__)
 # Sandbox URL configuration
 # Assuming sandbox is running locally on port 8001 based on user context
 SANDBOX_BASE_URL = "http://localhost:8001" 
+SUBMIT_HEADERS = {
+    "X-API-Key": "sandbox_demo_key_2026",
+    "Content-Type": "application/json"
+}
+
+# Connection pool for sandbox submissions; a shared client keeps
+# connections alive between submissions
+SUBMIT_TIMEOUT = 10.0
+SUBMIT_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+# Retries: attempts per submission, backoff bounds and total time budget (seconds)
+SUBMIT_MAX_ATTEMPTS = 3
+SUBMIT_BACKOFF_BASE = 0.5
+SUBMIT_BACKOFF_MAX = 8.0
+SUBMIT_RETRY_BUDGET = 20.0
 
 class SubmissionError(Exception):
     """Base exception for submission errors."""
     pass
 
-async def submit_application(job_id: str) -> Dict[str, Any]:
+class TransientSubmitError(SubmissionError):
+    """Sandbox response worth retrying (rate limited or server error)."""
+    pass
+
+class CircuitOpen(SubmissionError):
+    """The sandbox has been failing; submissions are refused for a while."""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        # Seconds until the breaker lets a probe submission through
+        self.retry_after = retry_after
+
+class CircuitBreaker:
+    """
+    Fail fast while an endpoint is down.
+    
+    CLOSED: calls go through. After `threshold` consecutive failed calls
+    the breaker OPENs and refuses calls for `cooldown` seconds. Then it is
+    HALF_OPEN: one probe call goes through, closing the breaker if it
+    succeeds and reopening it if it fails.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Raise CircuitOpen unless a call may go through now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            now = time.monotonic()
+            # A probe that never reported back doesn't hold the breaker
+            # half-open forever; another is allowed after a further cooldown
+            if now - self.opened_at >= self.cooldown:
+                # Let this call through as the probe
+                self.state = self.HALF_OPEN
+                self.opened_at = now
+                return
+            raise CircuitOpen(
+                "Sandbox unavailable; submissions paused after repeated failures",
+                retry_after=self.cooldown - (now - self.opened_at),
+            )
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failure_count = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failure_count += 1
+            if self.state == self.HALF_OPEN or self.failure_count >= self.threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+# Circuit breakers by sandbox base URL
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(base_url: str = SANDBOX_BASE_URL) -> CircuitBreaker:
+    """Get the circuit breaker guarding submissions to an endpoint."""
+    with _breakers_lock:
+        breaker = _breakers.get(base_url)
+        if breaker is None:
+            breaker = _breakers[base_url] = CircuitBreaker()
+        return breaker
+
+def create_submit_client() -> httpx.AsyncClient:
+    """Create a pooled client to share across submit_application() calls."""
+    return httpx.AsyncClient(timeout=SUBMIT_TIMEOUT, limits=SUBMIT_POOL_LIMITS)
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    Exponential backoff with full jitter.
+    
+    Waiting a random time up to the exponential bound keeps jobs that
+    failed together from retrying together.
+    """
+    return random.uniform(0, min(SUBMIT_BACKOFF_MAX, SUBMIT_BACKOFF_BASE * 2 ** attempt))
+
+async def _post_once(
+    client: httpx.AsyncClient,
+    url: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str]
+) -> Dict[str, Any]:
+    """
+    Post an application once and return the sandbox receipt.
+    
+    Raises:
+        TransientSubmitError: On 429 or 5xx responses.
+        httpx.HTTPStatusError: On other error responses.
+        SubmissionError: On any other unexpected status.
+    """
+    resp = await client.post(url, json=payload, headers=headers)
+    if resp.status_code in (200, 201):
+        return resp.json()
+    if resp.status_code == 429:
+        raise TransientSubmitError("Rate limited")
+    if resp.status_code >= 500:
+        raise TransientSubmitError(f"Server error {resp.status_code}")
+    resp.raise_for_status()
+    raise SubmissionError(f"Unexpected response status {resp.status_code}")
+
+async def submit_application(
+    job_id: str,
+    app_index: Optional[Dict[str, Dict[str, Any]]] = None,
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, Any]:
     """
     Submit the assembled application package for the given job.
     
@@ -42,8 +174,19 @@ async def submit_application(job_id: str) -> Dict[str, Any]:
     2. Extract the package.
     3. Send to Sandbox API with retries.
     4. Update status (submitted/failed).
+    
+    Raises CircuitOpen without contacting the sandbox, and without
+    changing the application, while the sandbox's circuit breaker is open.
+    
+    Args:
+        job_id: The job to submit for.
+        app_index: Optional map of job id to latest application, from
+            index_latest_applications(). Saves re-reading all applications
+            when the caller already has them loaded.
+        client: Optional shared client from create_submit_client(). The
+            caller owns it; without one, a client is created for this call.
     """
-    app_record = _find_ready_application(job_id)
+    app_record = _find_ready_application(job_id, app_index)
     if not app_record:
         raise SubmissionError(f"No assembled application found for job {job_id}")
 
@@ -75,59 +218,51 @@ async def submit_application(job_id: str) -> Dict[str, Any]:
 
     # Sandbox API Endpoint
     url = f"{SANDBOX_BASE_URL}/sandbox/jobs/{job_id}/apply"
-    headers = {
-        "X-API-Key": "sandbox_demo_key_2026",
-        "Content-Type": "application/json"
-    }
     
-    logger.info(f"Submitting application {app_record['id']} to {url}...")
+    logger.info("Submitting application %s to %s...", app_record["id"], url)
+    
+    breaker = get_circuit_breaker(SANDBOX_BASE_URL)
+    breaker.before_call()
     
     # Retry Loop
-    max_retries = 3
     attempt = 0
     receipt = None
     last_error = None
+    sandbox_down = False
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + SUBMIT_RETRY_BUDGET
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        while attempt < max_retries:
+    async with (contextlib.nullcontext(client) if client is not None else create_submit_client()) as client:
+        while True:
+            attempt += 1
+            logger.info("Submission attempt %d/%d", attempt, SUBMIT_MAX_ATTEMPTS)
             try:
-                attempt += 1
-                logger.info(f"Submission attempt {attempt}/{max_retries}")
-                
-                resp = await client.post(url, json=payload, headers=headers)
+                receipt = await _post_once(client, url, payload, SUBMIT_HEADERS)
+                logger.info("Submission successful!")
+                break
                 
-                if resp.status_code in [200, 201]:
-                    receipt = resp.json()
-                    logger.info("Submission successful!")
+            except (TransientSubmitError, httpx.TransportError) as e:
+                # Rate limits, server errors and network errors are retried
+                last_error = str(e) or type(e).__name__
+                wait_time = _backoff_delay(attempt)
+                if attempt >= SUBMIT_MAX_ATTEMPTS or loop.time() + wait_time > deadline:
+                    sandbox_down = True
                     break
-                    
-                # Handle Rate Limits
-                if resp.status_code == 429:
-                    wait_time = 2 ** attempt + random.uniform(0, 1)
-                    logger.warning(f"Rate limited. Waiting {wait_time:.2f}s...")
-                    await asyncio.sleep(wait_time)
-                    continue
-                    
-                # Handle Server Errors
-                if resp.status_code >= 500:
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Server error {resp.status_code}. Retrying in {wait_time}s...")
-                    await asyncio.sleep(wait_time)
-                    continue
-                    
-                # Client Errors (4xx) - Do not retry
-                resp.raise_for_status()
-                
-            except httpx.HTTPError as e:
-                last_error = str(e)
-                wait_time = 2 ** attempt
-                logger.warning(f"Network error: {e}. Retrying in {wait_time}s...")
+                logger.warning("%s. Retrying in %.2fs...", last_error, wait_time)
                 await asyncio.sleep(wait_time)
                 
             except Exception as e:
+                # Client errors (4xx) and bad responses - do not retry
                 last_error = str(e)
                 break
     
+    # Only exhausted retries count against the sandbox; a client error
+    # means it is up and answering
+    if sandbox_down:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    
     # Post-Loop Handling
     updates = {
         "updated_at": datetime.utcnow().isoformat()
@@ -162,8 +297,28 @@ async def submit_application(job_id: str) -> Dict[str, Any]:
         
     return result
 
-def _find_ready_application(job_id: str) -> Optional[Dict[str, Any]]:
+def index_latest_applications(applications: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map each job id to its most recently updated application."""
+    latest_by_job: Dict[str, Dict[str, Any]] = {}
+    for app in applications:
+        job_id = app.get("job_id")
+        current = latest_by_job.get(job_id)
+        if current is None or app.get("updated_at", "") > current.get("updated_at", ""):
+            latest_by_job[job_id] = app
+    return latest_by_job
+
+def _find_ready_application(
+    job_id: str,
+    app_index: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Optional[Dict[str, Any]]:
     """Find the latest 'assembled' application for a job."""
+    if app_index is not None:
+        # The latest application overall, if assembled, is also the latest
+        # assembled one; otherwise fall back to scanning all applications
+        latest = app_index.get(job_id)
+        if latest is not None and latest.get("status") == "assembled":
+            return latest
+    
     applications = load_applications()
     # Filter for job_id and status='assembled'
     candidates = [
@@ -4,21 +4,24 @@ Batch Processor Service
 Manages the autonomous execution of job applications in the background.
 Features:
 - Background worker thread
-- Queue processing from apply_queue.json
+- Queue processing from the apply queue
 - Rate limiting
 - Policy enforcement
 - Real-time progress tracking
 """
 
+import atexit
 import threading
-import time
-import json
 import asyncio
-from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 import traceback
 
+import httpx
+
+from app.config import settings
 from app.logging_config import get_logger
 from app.services.data_store import (
     load_applications,
@@ -27,14 +30,17 @@ from app.services.data_store import (
 )
 from app.services.apply_policy import check_application_policy
 from app.services.application_assembler import assemble_application_package
-from app.services.auto_submit import submit_application
+from app.services.auto_submit import (
+    CircuitOpen,
+    create_submit_client,
+    index_latest_applications,
+    submit_application
+)
 from app.services.audit_log import log_audit_event
+from app.services.job_ranker import get_queued_jobs
 
 logger = get_logger(__name__)
 
-DATA_DIR = Path(__file__).parent.parent.parent / "data"
-APPLY_QUEUE_FILE = DATA_DIR / "apply_queue.json"
-
 # ============================================================
 # Global State (Singleton-ish for simplicity)
 # ============================================================
@@ -49,7 +55,10 @@ class BatchState:
         self.failed_count = 0
         self.current_job_id: Optional[str] = None
         self.current_status: str = "idle"
-        self.logs: List[str] = []
+        # Final status when the batch is cut short by a failure (e.g. "circuit_open")
+        self.halt_status: Optional[str] = None
+        # Most recent log lines; older ones drop off the front
+        self.logs: Deque[str] = deque(maxlen=100)
         self.start_time: Optional[str] = None
 
     def reset(self):
@@ -59,16 +68,42 @@ class BatchState:
 
     def log(self, message: str):
         timestamp = datetime.utcnow().strftime("%H:%M:%S")
-        entry = f"[{timestamp}] {message}"
-        self.logs.append(entry)
-        # Keep logs manageable
-        if len(self.logs) > 100:
-            self.logs.pop(0)
+        self.logs.append(f"[{timestamp}] {message}")
 
 # Global instance
 _state = BatchState()
 _lock = threading.Lock()
 
+# Event loop shared by all batch runs (one runs at a time), closed at exit
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+class TokenBucket:
+    """
+    Async token bucket for pacing submissions.
+    
+    Allows bursts of up to `capacity` calls, then `rate` calls per second.
+    Tokens refill while callers are busy, so time spent assembling or
+    submitting counts toward the wait for the next slot.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill: Optional[float] = None
+
+    async def acquire(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            if self.last_refill is not None:
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
 # ============================================================
 # Services
 # ============================================================
@@ -117,121 +152,202 @@ def stop_batch_processing() -> Dict[str, Any]:
 # Worker
 # ============================================================
 
-def _read_queue() -> List[Dict[str, Any]]:
+# Statuses meaning the job was already applied to
+APPLIED_STATUSES = {"applied", "submitted", "interviewing", "offered", "rejected"}
+
+def _job_done(success: Optional[bool] = None):
+    """Record a finished job; success is None for skipped jobs."""
+    with _lock:
+        _state.processed_count += 1
+        if success is True:
+            _state.success_count += 1
+        elif success is False:
+            _state.failed_count += 1
+
+async def _admit_and_assemble(job_id: str, admission: asyncio.Lock) -> Optional[Dict[str, Any]]:
+    """
+    Check policy for a job and assemble its package.
+    
+    Returns None if the policy blocked the job. When the policy has a
+    daily limit, admission is held until the assembled application is
+    saved, since that record counts toward the limit; otherwise jobs
+    assemble concurrently.
+    """
+    await admission.acquire()
     try:
-        if APPLY_QUEUE_FILE.exists():
-            with open(APPLY_QUEUE_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data.get("queue", [])
-        return []
-    except Exception as e:
-        logger.error(f"Error reading apply queue: {e}")
-        return []
+        # 4. Check Policy
+        policy_check = await asyncio.to_thread(check_application_policy, job_id)
+        if not policy_check["allowed"]:
+            with _lock:
+                _state.log(f"Skipping {job_id}: Policy blocked - {policy_check['reason']}")
+            log_audit_event(job_id, "policy_check", {"status": "blocked", "reason": policy_check["reason"]}, "Application Policy")
+            return None
+        
+        log_audit_event(job_id, "policy_check", {"status": "allowed"}, "Application Policy")
+        
+        limit = policy_check["policy_snapshot"].get("daily_limit")
+        if not limit or limit <= 0:
+            admission.release()
+            admission = None
+        
+        # 5. Assemble (sync utility in assembler)
+        with _lock:
+            _state.current_status = "Assembling package..."
+        return await asyncio.to_thread(assemble_application_package, job_id)
+    finally:
+        if admission is not None:
+            admission.release()
+
+async def _process_job(
+    job_id: str,
+    latest_by_job: Dict[str, Dict[str, Any]],
+    semaphore: asyncio.Semaphore,
+    admission: asyncio.Lock,
+    bucket: TokenBucket,
+    client: httpx.AsyncClient
+):
+    """Run one queued job through the checks, assembly and submission."""
+    async with semaphore:
+        # Check Stop
+        if _state.stop_requested or _state.halt_status:
+            return
+        
+        with _lock:
+            _state.current_job_id = job_id
+            _state.current_status = f"Processing job {job_id}"
+            _state.log(f"Processing Job {job_id}...")
+
+        # 3. Check if already applied
+        existing = latest_by_job.get(job_id)
+        if existing and existing.get("status") in APPLIED_STATUSES:
+            with _lock:
+                _state.log(f"Skipping {job_id}: Already applied")
+            _job_done()
+            return
+
+        try:
+            package = await _admit_and_assemble(job_id, admission)
+        except Exception as e:
+            with _lock:
+                _state.log(f"Assembly failed for {job_id}: {e}")
+            log_audit_event(job_id, "assembly", {"status": "failed", "error": str(e)}, "Package Assembly")
+            _job_done(False)
+            return
+        if package is None:
+            _job_done()
+            return
+
+        # 6. Submit, paced by the token bucket
+        try:
+            with _lock:
+                _state.current_status = "Submitting..."
+            
+            # Pick up the application record assembly just saved
+            app_index = index_latest_applications(await asyncio.to_thread(load_applications))
+            await bucket.acquire()
+            result = await submit_application(job_id, app_index=app_index, client=client)
+            
+            with _lock:
+                _state.log(f"Successfully submitted to {job_id}")
+            log_audit_event(job_id, "submission", {"status": "success", "result": result}, "Final Submission")
+            _job_done(True)
+        
+        except CircuitOpen as e:
+            # The sandbox is down; stop starting jobs rather than failing each in turn
+            with _lock:
+                if not _state.halt_status:
+                    _state.log(f"Stopping batch: {e}")
+                _state.halt_status = "circuit_open"
+            log_audit_event(job_id, "submission", {"status": "failed", "error": str(e)}, "Final Submission")
+            _job_done(False)
+                
+        except Exception as e:
+            with _lock:
+                _state.log(f"Submission failed for {job_id}: {e}")
+            log_audit_event(job_id, "submission", {"status": "failed", "error": str(e)}, "Final Submission")
+            _job_done(False)
+
+async def _run_queue(queue: List[Dict[str, Any]]):
+    """Process queued jobs, up to batch_max_concurrency at a time."""
+    # Latest application per job, read once rather than once per job
+    latest_by_job = index_latest_applications(await asyncio.to_thread(load_applications))
+    semaphore = asyncio.Semaphore(settings.batch_max_concurrency)
+    admission = asyncio.Lock()
+    bucket = TokenBucket(settings.batch_submit_rate, settings.batch_submit_burst)
+    
+    # One pooled client for the whole batch, so submissions reuse connections
+    async with create_submit_client() as client:
+        tasks = [
+            asyncio.create_task(_process_job(job_entry.get("id"), latest_by_job, semaphore, admission, bucket, client))
+            for job_entry in queue
+        ]
+        try:
+            # Jobs record their own progress; await them as they finish
+            for task in asyncio.as_completed(tasks):
+                await task
+        finally:
+            # The loop outlives this batch; don't leave jobs running on it
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the event loop batch runs execute on, creating it on first use.
+    
+    Blocking steps (policy checks, assembly) run on its executor; each job
+    has at most one in flight, so one thread per concurrent job is enough.
+    """
+    global _worker_loop
+    with _lock:
+        if _worker_loop is None or _worker_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            loop.set_default_executor(
+                ThreadPoolExecutor(max_workers=settings.batch_max_concurrency, thread_name_prefix="batch")
+            )
+            _worker_loop = loop
+        return _worker_loop
+
+def _close_worker_loop():
+    """Close the batch event loop and its executor, unless a batch is running on it."""
+    loop = _worker_loop
+    if loop is None or loop.is_closed() or loop.is_running():
+        return
+    loop.run_until_complete(loop.shutdown_default_executor())
+    loop.close()
+
+atexit.register(_close_worker_loop)
 
 def _worker(student_id: Optional[str]):
-    """Background worker loops through queue."""
+    """Background worker processing the queue."""
     
     # 1. Load Queue
-    queue = _read_queue()
+    # Read through the ranker so unflushed queue changes are included
+    queue = get_queued_jobs()
     with _lock:
         _state.total_jobs = len(queue)
         _state.log(f"Loaded {len(queue)} jobs from queue")
 
-    # 2. Process Loop
-    processed_count = 0
-    
-    # Create a new event loop for this thread since we need to call async submit_application
-    loop = asyncio.new_event_loop()
+    # 2. Process the queue on the shared batch event loop
+    loop = _get_worker_loop()
     asyncio.set_event_loop(loop)
     
     try:
-        for job_entry in queue:
-            # Check Stop
-            if _state.stop_requested:
-                with _lock:
-                    _state.log("Batch stopped manually.")
-                    _state.current_status = "stopped"
-                break
-                
-            job_id = job_entry.get("id")
-            
-            with _lock:
-                _state.current_job_id = job_id
-                _state.current_status = f"Processing job {job_id}"
-                _state.log(f"Processing Job {job_id}...")
-
-            # 3. Check if already applied
-            applications = load_applications()
-            existing = next((a for a in applications if a.get("job_id") == job_id), None)
-            
-            if existing and existing.get("status") in ["applied", "submitted", "interviewing", "offered", "rejected"]:
-                with _lock:
-                    _state.log(f"Skipping {job_id}: Already applied")
-                processed_count += 1
-                continue
-
-            # 4. Check Policy
-            policy_check = check_application_policy(job_id)
-            if not policy_check["allowed"]:
-                with _lock:
-                    _state.log(f"Skipping {job_id}: Policy blocked - {policy_check['reason']}")
-                log_audit_event(job_id, "policy_check", {"status": "blocked", "reason": policy_check["reason"]}, "Application Policy")
-                processed_count += 1
-                continue
-            
-            log_audit_event(job_id, "policy_check", {"status": "allowed"}, "Application Policy")
-
-            # 5. Assemble
-            try:
-                with _lock:
-                    _state.current_status = "Assembling package..."
-                
-                # Sync utility in assembler
-                package = assemble_application_package(job_id) 
-                
-            except Exception as e:
-                with _lock:
-                    _state.log(f"Assembly failed for {job_id}: {e}")
-                    _state.failed_count += 1
-                log_audit_event(job_id, "assembly", {"status": "failed", "error": str(e)}, "Package Assembly")
-                processed_count += 1
-                continue
-
-            # 6. Submit (Async)
-            try:
-                with _lock:
-                    _state.current_status = "Submitting..."
-                
-                # Run async task in sync thread
-                result = loop.run_until_complete(submit_application(job_id))
-                
-                with _lock:
-                    _state.log(f"Successfully submitted to {job_id}")
-                    _state.success_count += 1
-                
-                log_audit_event(job_id, "submission", {"status": "success", "result": result}, "Final Submission")
-                    
-            except Exception as e:
-                with _lock:
-                    _state.log(f"Submission failed for {job_id}: {e}")
-                    _state.failed_count += 1
-                log_audit_event(job_id, "submission", {"status": "failed", "error": str(e)}, "Final Submission")
-            
-            # 7. Rate Limit / Pacing
-            # Sleep 5 seconds between apps
-            processed_count += 1
-            with _lock:
-                _state.processed_count = processed_count
-                
-            time.sleep(5)
-            
+        loop.run_until_complete(_run_queue(queue))
+        
         # Done
         with _lock:
-            _state.log("Batch processing completed.")
-            _state.current_status = "completed"
+            if _state.halt_status:
+                _state.current_status = _state.halt_status
+            elif _state.stop_requested:
+                _state.log("Batch stopped manually.")
+                _state.current_status = "stopped"
+            else:
+                _state.log("Batch processing completed.")
+                _state.current_status = "completed"
             
     except Exception as e:
-        logger.error(f"Batch worker crash: {e}")
+        logger.error("Batch worker crash: %s", e)
         with _lock:
             _state.log(f"Process crashed: {e}")
             _state.current_status = "crashed"
@@ -240,4 +356,4 @@ def _worker(student_id: Optional[str]):
             _state.is_running = False
             _state.stop_requested = False
             _state.current_job_id = None
-        loop.close()
+        asyncio.set_event_loop(None)
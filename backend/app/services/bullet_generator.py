@@ -7,12 +7,11 @@ All bullets are grounded to specific projects/experiences from the profile.
 """
 
 import json
-import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import uuid
 from datetime import datetime
 
-from app.services.llm_client import generate_json, LLMClientError
+from app.services.llm_client import generate_json, strip_json_fences, LLMClientError
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -29,6 +28,19 @@ BULLET_CATEGORIES = {
     "collaboration": ["collaborated", "partnered", "worked with", "stakeholder", "cross-team"],
 }
 
+
+def _invert_categories() -> Dict[str, Tuple[str, ...]]:
+    """Map each distinct keyword to every category it belongs to (e.g. "sql" -> backend, data)."""
+    keyword_categories: Dict[str, Tuple[str, ...]] = {}
+    for category, keywords in BULLET_CATEGORIES.items():
+        for keyword in keywords:
+            keyword_categories[keyword] = keyword_categories.get(keyword, ()) + (category,)
+    return keyword_categories
+
+
+# (keyword, categories) pairs, so each keyword is checked once per bullet
+_KEYWORD_CATEGORIES = tuple(_invert_categories().items())
+
 # Prompt for bullet generation
 BULLET_GENERATION_PROMPT = """You are an expert resume writer. Generate achievement bullets from the following profile data.
 
@@ -73,21 +85,20 @@ def categorize_bullet(bullet_text: str, technologies: List[str]) -> List[str]:
     Returns:
         List of category tags.
     """
-    categories = set()
-    text_lower = bullet_text.lower()
-    tech_lower = [t.lower() for t in technologies]
-    
-    for category, keywords in BULLET_CATEGORIES.items():
-        for keyword in keywords:
-            if keyword in text_lower or keyword in " ".join(tech_lower):
-                categories.add(category)
-                break
+    # Text and technologies are searched together; no keyword contains a
+    # newline, so a match can't span the two
+    haystack = bullet_text.lower() + "\n" + " ".join(technologies).lower()
+    found = set()
+    for keyword, keyword_categories in _KEYWORD_CATEGORIES:
+        if keyword in haystack:
+            found.update(keyword_categories)
+    categories = [category for category in BULLET_CATEGORIES if category in found]
     
     # Default to "general" if no categories matched
     if not categories:
-        categories.add("general")
+        categories.append("general")
     
-    return list(categories)
+    return categories
 
 
 def generate_bullets_from_profile(profile_data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -125,9 +136,7 @@ def generate_bullets_from_profile(profile_data: Dict[str, Any]) -> List[Dict[str
         )
         
         # Extract JSON from response
-        json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', response_text)
-        if json_match:
-            response_text = json_match.group(1)
+        response_text = strip_json_fences(response_text)
         
         # Parse JSON
         try:
@@ -4,11 +4,13 @@ Bullet Bank Storage Service
 Handles storing and retrieving generated achievement bullets.
 """
 
-import json
 import threading
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import orjson
 
 from app.logging_config import get_logger
 
@@ -16,47 +18,186 @@ logger = get_logger(__name__)
 
 # Data directory path
 DATA_DIR = Path(__file__).parent.parent / "data"
-BULLET_BANK_FILE = DATA_DIR / "bullet_bank.json"
+# One bullet per line, appended as bullets are saved
+BULLET_BANK_FILE = DATA_DIR / "bullet_bank.jsonl"
+# Former whole-file format ({"bullets": [...]}). Copied into the JSON lines
+# file on first use and left in place (it ships with the repo); once the
+# JSON lines file exists it is ignored.
+LEGACY_BULLET_BANK_FILE = DATA_DIR / "bullet_bank.json"
 
-# Thread lock for concurrent access
+# Serializes writers and cache reloads. Readers don't take it: they use the
+# current cache snapshot, which writers replace in a single assignment and
+# never modify in place. A write is visible to readers in this process as
+# soon as it returns; writes from other processes once the file mtime moves.
 _bullets_lock = threading.RLock()
 
+# Bumped on every bullet bank write; combined with the file mtime as a version token
+_bullets_version = 0
+
+# (data version, bullets, lookup indexes) for the last bank read or written
+_bullets_cache: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]], Dict[str, Any]]] = None
+
 
 def _ensure_data_dir() -> None:
     """Ensure the data directory exists."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _read_bullet_bank() -> Dict[str, Any]:
-    """Read the bullet bank JSON file."""
+def _encode_bullets(bullets: Iterable[Dict[str, Any]]) -> bytes:
+    """Encode bullets as JSON lines."""
+    return b"".join(orjson.dumps(b, option=orjson.OPT_NON_STR_KEYS, default=str) + b"\n" for b in bullets)
+
+
+def _new_index() -> Dict[str, Any]:
+    """Empty lookup indexes: by id, by category, and bank positions by lowercased source name."""
+    return {"by_id": {}, "by_category": defaultdict(list), "by_source": defaultdict(list)}
+
+
+def _index_bullets(index: Dict[str, Any], bullets: List[Dict[str, Any]], start: int = 0) -> None:
+    """Add bullets, stored from bank position `start` on, to the indexes."""
+    for position, bullet in enumerate(bullets, start):
+        # Like a linear scan, the first bullet with an id wins
+        index["by_id"].setdefault(bullet.get("id"), bullet)
+        for category in dict.fromkeys(bullet.get("categories", [])):
+            index["by_category"][category].append(bullet)
+        index["by_source"][bullet.get("source_name", "").lower()].append(position)
+
+
+def _copy_index(index: Dict[str, Any], bullets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Copy indexes for adding bullets to, leaving the original untouched.
+    
+    Only the lists the new bullets will be added to are copied.
+    """
+    by_category = defaultdict(list, index["by_category"])
+    by_source = defaultdict(list, index["by_source"])
+    for bullet in bullets:
+        for category in bullet.get("categories", []):
+            if by_category.get(category) is index["by_category"].get(category):
+                by_category[category] = list(by_category.get(category, []))
+        source = bullet.get("source_name", "").lower()
+        if by_source.get(source) is index["by_source"].get(source):
+            by_source[source] = list(by_source.get(source, []))
+    return {"by_id": dict(index["by_id"]), "by_category": by_category, "by_source": by_source}
+
+
+def _migrate_legacy_bank() -> None:
+    """Copy bullet_bank.json into the JSON lines file, if it hasn't been yet."""
+    if BULLET_BANK_FILE.exists() or not LEGACY_BULLET_BANK_FILE.exists():
+        return
     try:
-        if BULLET_BANK_FILE.exists():
-            with open(BULLET_BANK_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return {"bullets": []}
+        with open(LEGACY_BULLET_BANK_FILE, "rb") as f:
+            bullets = orjson.loads(f.read()).get("bullets", [])
+        if _write_bullet_bank(bullets):
+            logger.info("Migrated bullet bank to JSON lines format")
+    except Exception as e:
+        logger.error(f"Error migrating bullet bank file: {e}")
+
+
+def _load_bullet_bank() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Get all bullets and their lookup indexes, re-reading the file only if
+    the bank changed since last read.
+    
+    Both are shared with the cache and must not be mutated.
+    """
+    global _bullets_cache
+    snapshot = _bullets_cache
+    if snapshot is not None and snapshot[0] == get_bullet_bank_version():
+        return snapshot[1], snapshot[2]
+    
+    with _bullets_lock:
+        _migrate_legacy_bank()
+        version = get_bullet_bank_version()
+        if _bullets_cache is not None and _bullets_cache[0] == version:
+            return _bullets_cache[1], _bullets_cache[2]
+        
+        bullets = []
+        try:
+            if BULLET_BANK_FILE.exists():
+                with open(BULLET_BANK_FILE, "rb") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            bullets.append(orjson.loads(line))
+                        except orjson.JSONDecodeError:
+                            logger.warning("Skipping malformed bullet bank line")
+        except Exception as e:
+            logger.error(f"Error reading bullet bank file: {e}")
+        index = _new_index()
+        _index_bullets(index, bullets)
+        _bullets_cache = (version, bullets, index)
+        return bullets, index
+
+
+def _read_bullet_bank() -> List[Dict[str, Any]]:
+    """Read all bullets. The returned list is shared with the cache and must not be mutated."""
+    return _load_bullet_bank()[0]
+
+
+def _append_bullets(bullets: List[Dict[str, Any]]) -> bool:
+    """Append bullets to the bullet bank file, without rewriting existing ones."""
+    global _bullets_version, _bullets_cache
+    try:
+        existing, index = _load_bullet_bank()
+        _ensure_data_dir()
+        with open(BULLET_BANK_FILE, "ab") as f:
+            f.write(_encode_bullets(bullets))
+        _bullets_version += 1
+        # Extend the cache and indexes with the new bullets instead of
+        # re-reading; copies, since readers may be using the current ones
+        added = [dict(b) for b in bullets]
+        index = _copy_index(index, added)
+        _index_bullets(index, added, len(existing))
+        _bullets_cache = (get_bullet_bank_version(), existing + added, index)
+        return True
     except Exception as e:
-        logger.error(f"Error reading bullet bank file: {e}")
-        return {"bullets": []}
+        logger.error(f"Error writing bullet bank file: {e}")
+        return False
 
 
-def _write_bullet_bank(data: Dict[str, Any]) -> bool:
-    """Write to the bullet bank JSON file."""
+def _write_bullet_bank(bullets: List[Dict[str, Any]]) -> bool:
+    """Rewrite the whole bullet bank file (used when bullets are removed)."""
+    global _bullets_version, _bullets_cache
     try:
         _ensure_data_dir()
         temp_path = BULLET_BANK_FILE.with_suffix(".tmp")
-        with open(temp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        with open(temp_path, "wb") as f:
+            f.write(_encode_bullets(bullets))
         temp_path.replace(BULLET_BANK_FILE)
+        _bullets_version += 1
+        bullets = list(bullets)
+        index = _new_index()
+        _index_bullets(index, bullets)
+        _bullets_cache = (get_bullet_bank_version(), bullets, index)
         return True
     except Exception as e:
         logger.error(f"Error writing bullet bank file: {e}")
         return False
 
 
+def get_bullet_bank_version() -> Tuple[int, int]:
+    """
+    Get a token that changes whenever the bullet bank changes.
+    
+    Returns:
+        Tuple of (write counter, file mtime in ns).
+    """
+    try:
+        mtime_ns = BULLET_BANK_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _bullets_version, mtime_ns
+
+
 def save_bullets(bullets: List[Dict[str, Any]], profile_id: Optional[str] = None) -> bool:
     """
     Save generated bullets to the bullet bank.
     
+    New bullets are appended to the file, so saving costs the same no
+    matter how many bullets are already stored.
+    
     Args:
         bullets: List of bullet dictionaries to save.
         profile_id: Optional profile ID to associate bullets with.
@@ -65,100 +206,92 @@ def save_bullets(bullets: List[Dict[str, Any]], profile_id: Optional[str] = None
         True if save was successful.
     """
     with _bullets_lock:
-        data = _read_bullet_bank()
-        
         # Add profile association and timestamp to each bullet
         for bullet in bullets:
             if profile_id:
                 bullet["profile_id"] = profile_id
             bullet["saved_at"] = datetime.utcnow().isoformat()
         
-        # Append new bullets
-        data["bullets"].extend(bullets)
-        
-        if _write_bullet_bank(data):
+        if _append_bullets(bullets):
             logger.info(f"Saved {len(bullets)} bullets to bullet bank")
             return True
         return False
 
 
 def get_all_bullets() -> List[Dict[str, Any]]:
-    """Get all bullets from the bullet bank."""
-    with _bullets_lock:
-        data = _read_bullet_bank()
-        return data.get("bullets", [])
+    """
+    Get all bullets from the bullet bank.
+    
+    The list is a fresh copy but the bullet dictionaries are shared with
+    the cache and must not be mutated.
+    """
+    return list(_read_bullet_bank())
 
 
 def get_bullets_by_category(category: str) -> List[Dict[str, Any]]:
     """Get bullets filtered by category."""
-    with _bullets_lock:
-        data = _read_bullet_bank()
-        bullets = data.get("bullets", [])
-        return [b for b in bullets if category in b.get("categories", [])]
+    _, index = _load_bullet_bank()
+    return list(index["by_category"].get(category, []))
 
 
 def get_bullets_by_source(source_name: str) -> List[Dict[str, Any]]:
     """Get bullets filtered by source name."""
-    with _bullets_lock:
-        data = _read_bullet_bank()
-        bullets = data.get("bullets", [])
-        return [
-            b for b in bullets 
-            if source_name.lower() in b.get("source_name", "").lower()
-        ]
+    source_lower = source_name.lower()
+    bullets, index = _load_bullet_bank()
+    # Match against each distinct source name once, then return the
+    # matching bullets in bank order
+    positions = [
+        position
+        for name, name_positions in index["by_source"].items()
+        if source_lower in name
+        for position in name_positions
+    ]
+    return [bullets[position] for position in sorted(positions)]
 
 
 def get_bullet_by_id(bullet_id: str) -> Optional[Dict[str, Any]]:
     """Get a specific bullet by ID."""
-    with _bullets_lock:
-        data = _read_bullet_bank()
-        for bullet in data.get("bullets", []):
-            if bullet.get("id") == bullet_id:
-                return bullet
-        return None
+    _, index = _load_bullet_bank()
+    return index["by_id"].get(bullet_id)
 
 
 def delete_bullet(bullet_id: str) -> bool:
     """Delete a bullet by ID."""
     with _bullets_lock:
-        data = _read_bullet_bank()
-        original_count = len(data["bullets"])
-        data["bullets"] = [b for b in data["bullets"] if b.get("id") != bullet_id]
+        bullets = _read_bullet_bank()
+        remaining = [b for b in bullets if b.get("id") != bullet_id]
         
-        if len(data["bullets"]) < original_count:
-            return _write_bullet_bank(data)
+        if len(remaining) < len(bullets):
+            return _write_bullet_bank(remaining)
         return False
 
 
 def clear_all_bullets() -> bool:
     """Clear all bullets from the bullet bank."""
     with _bullets_lock:
-        data = {"bullets": []}
-        return _write_bullet_bank(data)
+        return _write_bullet_bank([])
 
 
 def get_bullet_stats() -> Dict[str, Any]:
     """Get statistics about the bullet bank."""
-    with _bullets_lock:
-        data = _read_bullet_bank()
-        bullets = data.get("bullets", [])
-        
-        # Count by category
-        category_counts = {}
-        for bullet in bullets:
-            for category in bullet.get("categories", []):
-                category_counts[category] = category_counts.get(category, 0) + 1
-        
-        # Count by source type
-        source_type_counts = {}
-        for bullet in bullets:
-            source_type = bullet.get("source_type", "unknown")
-            source_type_counts[source_type] = source_type_counts.get(source_type, 0) + 1
-        
-        return {
-            "total_bullets": len(bullets),
-            "by_category": category_counts,
-            "by_source_type": source_type_counts,
-            "with_metrics": sum(1 for b in bullets if b.get("has_metrics")),
-            "grounded": sum(1 for b in bullets if b.get("is_grounded", True)),
-        }
+    bullets = _read_bullet_bank()
+    
+    # Count by category
+    category_counts = {}
+    for bullet in bullets:
+        for category in bullet.get("categories", []):
+            category_counts[category] = category_counts.get(category, 0) + 1
+    
+    # Count by source type
+    source_type_counts = {}
+    for bullet in bullets:
+        source_type = bullet.get("source_type", "unknown")
+        source_type_counts[source_type] = source_type_counts.get(source_type, 0) + 1
+    
+    return {
+        "total_bullets": len(bullets),
+        "by_category": category_counts,
+        "by_source_type": source_type_counts,
+        "with_metrics": sum(1 for b in bullets if b.get("has_metrics")),
+        "grounded": sum(1 for b in bullets if b.get("is_grounded", True)),
+    }
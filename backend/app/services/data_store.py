@@ -5,13 +5,14 @@ Thread-safe JSON file persistence for student profiles, jobs, and applications.
 Uses file locking for concurrent access safety.
 """
 
+import heapq
 import json
 import os
 import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.logging_config import get_logger
 
@@ -23,6 +24,7 @@ DATA_DIR = Path(__file__).parent.parent.parent / "data"
 # File paths
 STUDENT_PROFILE_FILE = DATA_DIR / "student_profile.json"
 JOBS_FILE = DATA_DIR / "jobs.json"
+JOBS_JOURNAL_FILE = DATA_DIR / "jobs.journal"
 APPLICATIONS_FILE = DATA_DIR / "applications.json"
 
 # Thread locks for concurrent access
@@ -30,6 +32,43 @@ _profile_lock = threading.RLock()
 _jobs_lock = threading.RLock()
 _applications_lock = threading.RLock()
 
+# Bumped on every profile/jobs/applications write so readers can cheaply detect changes
+_profile_version = 0
+_jobs_version = 0
+_applications_version = 0
+
+# Single-job updates are appended to the journal instead of rewriting
+# jobs.json; once it holds this many entries it is folded into a snapshot
+JOBS_JOURNAL_COMPACT_AFTER = 200
+
+# (data version, profile) for the last profile read or written
+_profile_cache: Optional[Tuple[Tuple[int, int], Optional[Dict[str, Any]]]] = None
+
+# Joins fields in a combined search key (ASCII unit separator)
+_SEARCH_KEY_SEP = "\x1f"
+
+# (data version, parsed jobs list, job id -> job index)
+_jobs_cache: Optional[
+    Tuple[Tuple[int, int, int], List[Dict[str, Any]], Dict[str, Dict[str, Any]]]
+] = None
+
+# Snapshot stamp (jobs.json updated_at) the journal applies to, and its length
+_jobs_journal_base: Optional[str] = None
+_jobs_journal_entries = 0
+
+# (data version, jobs, lowercased (company, company + title, location) keys)
+_job_search_index: Optional[
+    Tuple[Tuple[int, int, int], List[Dict[str, Any]], List[Tuple[str, str, str]]]
+] = None
+
+# (data version, parsed applications list)
+_applications_cache: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = None
+
+# (data version, applications, lowercased (company_name, job_title) keys)
+_application_search_index: Optional[
+    Tuple[Tuple[int, int], List[Dict[str, Any]], List[Tuple[str, str]]]
+] = None
+
 
 def _ensure_data_dir() -> None:
     """Ensure the data directory exists."""
@@ -71,42 +110,80 @@ def _write_json_file(file_path: Path, data: Any) -> bool:
 # Student Profile Functions
 # ============================================================
 
-def save_student_profile(data: Dict[str, Any]) -> bool:
+def save_student_profile(data: Optional[Dict[str, Any]]) -> bool:
     """
     Save student profile data.
     
+    The updated_at/created_at timestamps are set on ``data`` in place, so
+    after a successful save it matches the stored profile. A created_at
+    already on the stored profile is kept when ``data`` has none.
+    
     Args:
         data: Dictionary containing student profile information.
               Expected fields: name, email, phone, education, skills,
-              experience, resume_path, etc.
+              experience, resume_path, etc. None clears the profile.
     
     Returns:
         True if saved successfully, False otherwise.
     """
+    global _profile_version, _profile_cache
     with _profile_lock:
-        # Add metadata
-        data["updated_at"] = datetime.utcnow().isoformat()
-        if "created_at" not in data:
-            data["created_at"] = datetime.utcnow().isoformat()
+        if data is not None:
+            # Add metadata
+            now = datetime.utcnow().isoformat()
+            data["updated_at"] = now
+            if "created_at" not in data:
+                existing = load_student_profile()
+                data["created_at"] = (existing or {}).get("created_at") or now
         
         profile_data = {"profile": data}
         success = _write_json_file(STUDENT_PROFILE_FILE, profile_data)
+        _profile_version += 1
         
         if success:
+            # Serve the next read from memory instead of re-parsing the file
+            _profile_cache = (
+                get_student_profile_version(),
+                dict(data) if data is not None else None,
+            )
             logger.info("Student profile saved successfully")
         return success
 
 
+def get_student_profile_version() -> Tuple[int, int]:
+    """
+    Get a token that changes whenever the student profile changes.
+    
+    Returns:
+        Tuple of (write counter, file mtime in ns).
+    """
+    try:
+        mtime_ns = STUDENT_PROFILE_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _profile_version, mtime_ns
+
+
 def load_student_profile() -> Optional[Dict[str, Any]]:
     """
     Load student profile data.
     
+    The parsed profile is cached and the file is only re-read when the
+    profile data version changes.
+    
     Returns:
-        Dictionary containing student profile, or None if not found.
+        Dictionary containing student profile, or None if not found. The
+        dictionary is a copy, but nested lists/dicts are shared with the
+        cache and must not be mutated without saving.
     """
+    global _profile_cache
     with _profile_lock:
-        data = _read_json_file(STUDENT_PROFILE_FILE, {"profile": None})
-        return data.get("profile")
+        version = get_student_profile_version()
+        if _profile_cache is None or _profile_cache[0] != version:
+            data = _read_json_file(STUDENT_PROFILE_FILE, {"profile": None})
+            _profile_cache = (version, data.get("profile"))
+        profile = _profile_cache[1]
+        return dict(profile) if profile is not None else None
 
 
 # ============================================================
@@ -125,6 +202,7 @@ def save_jobs(jobs_list: List[Dict[str, Any]]) -> bool:
     Returns:
         True if saved successfully, False otherwise.
     """
+    global _jobs_version
     with _jobs_lock:
         # Ensure each job has an ID
         for job in jobs_list:
@@ -135,6 +213,10 @@ def save_jobs(jobs_list: List[Dict[str, Any]]) -> bool:
         
         jobs_data = {"jobs": jobs_list, "updated_at": datetime.utcnow().isoformat()}
         success = _write_json_file(JOBS_FILE, jobs_data)
+        if success:
+            # The snapshot includes every journaled update
+            JOBS_JOURNAL_FILE.unlink(missing_ok=True)
+        _jobs_version += 1
         
         if success:
             logger.info(f"Saved {len(jobs_list)} jobs")
@@ -166,16 +248,114 @@ def add_job(job: Dict[str, Any]) -> Optional[str]:
         return None
 
 
+def add_jobs(new_jobs: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Add several jobs with a single write.
+    
+    Args:
+        new_jobs: Job dictionaries with title, company, location, etc.
+    
+    Returns:
+        The full jobs list (existing plus new) if saved successfully,
+        None otherwise.
+    """
+    with _jobs_lock:
+        now = datetime.utcnow().isoformat()
+        for job in new_jobs:
+            if "id" not in job:
+                job["id"] = str(uuid.uuid4())
+            job["created_at"] = now
+        
+        jobs = load_jobs() + new_jobs
+        
+        if save_jobs(jobs):
+            return jobs
+        return None
+
+
+def _get_jobs_cache() -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Get the parsed jobs list and its id index.
+    
+    The file is only re-read and re-parsed when the jobs data version
+    changes; otherwise the cached list and index are returned as-is.
+    Journaled updates are replayed on top of the jobs.json snapshot.
+    """
+    global _jobs_cache, _jobs_journal_base, _jobs_journal_entries
+    with _jobs_lock:
+        version = get_jobs_version()
+        if _jobs_cache is None or _jobs_cache[0] != version:
+            data = _read_json_file(JOBS_FILE, {"jobs": []})
+            jobs = data.get("jobs", [])
+            index = {job["id"]: job for job in jobs if "id" in job}
+            _jobs_journal_base = data.get("updated_at")
+            _jobs_journal_entries = _replay_jobs_journal(index, _jobs_journal_base)
+            _jobs_cache = (version, jobs, index)
+        return _jobs_cache[1], _jobs_cache[2]
+
+
+def _replay_jobs_journal(index: Dict[str, Dict[str, Any]], base: Optional[str]) -> int:
+    """
+    Apply journaled job updates to freshly loaded jobs.
+    
+    Entries recorded against a different snapshot (e.g. jobs.json was
+    replaced by a script) are skipped.
+    
+    Returns:
+        Number of entries in the journal.
+    """
+    try:
+        with open(JOBS_JOURNAL_FILE, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return 0
+    except Exception as e:
+        logger.error(f"Error reading file {JOBS_JOURNAL_FILE}: {e}")
+        return 0
+    
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            # A torn final line from an interrupted append
+            continue
+        if entry.get("base") != base:
+            continue
+        job = index.get(entry.get("id"))
+        if job is not None:
+            job.update(entry.get("updates", {}))
+    return len(lines)
+
+
+def get_jobs_version() -> Tuple[int, int, int]:
+    """
+    Get a token that changes whenever the jobs data changes.
+    
+    Returns:
+        Tuple of (write counter, jobs.json mtime in ns, journal mtime in ns).
+    """
+    try:
+        mtime_ns = JOBS_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    try:
+        journal_mtime_ns = JOBS_JOURNAL_FILE.stat().st_mtime_ns
+    except OSError:
+        journal_mtime_ns = 0
+    return _jobs_version, mtime_ns, journal_mtime_ns
+
+
 def load_jobs() -> List[Dict[str, Any]]:
     """
     Load all jobs.
     
     Returns:
-        List of job dictionaries.
+        List of job dictionaries. The list is a fresh copy but the job
+        dictionaries are shared with the cache and must not be mutated
+        without saving them back.
     """
-    with _jobs_lock:
-        data = _read_json_file(JOBS_FILE, {"jobs": []})
-        return data.get("jobs", [])
+    jobs, _ = _get_jobs_cache()
+    return list(jobs)
 
 
 def get_job_by_id(job_id: str) -> Optional[Dict[str, Any]]:
@@ -186,13 +366,164 @@ def get_job_by_id(job_id: str) -> Optional[Dict[str, Any]]:
         job_id: The job's unique identifier.
     
     Returns:
-        Job dictionary or None if not found.
+        Copy of the job dictionary or None if not found.
     """
-    jobs = load_jobs()
-    for job in jobs:
-        if job.get("id") == job_id:
-            return job
-    return None
+    _, index = _get_jobs_cache()
+    job = index.get(job_id)
+    return dict(job) if job is not None else None
+
+
+def _get_job_search_index() -> Tuple[List[Dict[str, Any]], List[Tuple[str, str, str]]]:
+    """
+    Get jobs with precomputed lowercase search keys.
+    
+    The keys are rebuilt only when the jobs data version changes, so
+    filtering doesn't re-lowercase every record on every request. Company
+    and title are also joined with a separator that can't appear in a
+    search term, so a title-or-company search is one substring scan.
+    """
+    global _job_search_index
+    with _jobs_lock:
+        version = get_jobs_version()
+        if _job_search_index is None or _job_search_index[0] != version:
+            jobs, _ = _get_jobs_cache()
+            keys = []
+            for j in jobs:
+                company = (j.get("company") or "").lower()
+                title = (j.get("title") or "").lower()
+                location = (j.get("location") or "").lower()
+                keys.append((company, company + _SEARCH_KEY_SEP + title, location))
+            _job_search_index = (version, jobs, keys)
+        return _job_search_index[1], _job_search_index[2]
+
+
+def query_jobs(
+    search: Optional[str] = None,
+    company: Optional[str] = None,
+    location: Optional[str] = None,
+    remote: Optional[bool] = None,
+    job_type: Optional[str] = None,
+    is_favorite: Optional[bool] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Filter jobs in a single pass over a cached search index.
+    
+    Cheap equality checks run before substring matches. Returned records
+    are shared with the cache and must not be mutated.
+    
+    Args:
+        search: Case-insensitive substring of title or company.
+        company: Case-insensitive substring of company.
+        location: Case-insensitive substring of location.
+        remote: Exact remote flag.
+        job_type: Exact job type.
+        is_favorite: Exact favorite flag.
+    
+    Returns:
+        List of matching jobs in stored order.
+    """
+    # The separator never matches legitimately, so dropping it can't lose hits
+    search_lower = search.lower().replace(_SEARCH_KEY_SEP, "") if search else None
+    company_lower = company.lower() if company else None
+    location_lower = location.lower() if location else None
+    
+    jobs, keys = _get_job_search_index()
+    
+    matches = []
+    for job, (job_company, job_search_text, job_location) in zip(jobs, keys):
+        if remote is not None and job.get("remote") != remote:
+            continue
+        if is_favorite is not None and job.get("is_favorite") != is_favorite:
+            continue
+        if job_type and job.get("job_type") != job_type:
+            continue
+        if company_lower and company_lower not in job_company:
+            continue
+        if search_lower and search_lower not in job_search_text:
+            continue
+        if location_lower and location_lower not in job_location:
+            continue
+        matches.append(job)
+    
+    return matches
+
+
+def update_job(job_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Update an existing job in place.
+    
+    The change is appended to the jobs journal, so a single-record update
+    writes O(1) bytes instead of the whole jobs file.
+    
+    Args:
+        job_id: The job's unique identifier.
+        updates: Dictionary of fields to update.
+    
+    Returns:
+        The updated job if saved successfully, None if not found or the
+        save failed.
+    """
+    with _jobs_lock:
+        jobs, index = _get_jobs_cache()
+        job = index.get(job_id)
+        if job is None:
+            return None
+        
+        job.update(updates)
+        
+        if _jobs_journal_entries + 1 >= JOBS_JOURNAL_COMPACT_AFTER:
+            return dict(job) if save_jobs(jobs) else None
+        
+        if _append_jobs_journal(job_id, updates):
+            return dict(job)
+        return None
+
+
+def _append_jobs_journal(job_id: str, updates: Dict[str, Any]) -> bool:
+    """
+    Append a job update to the journal and keep the cache in sync.
+    
+    Must be called with _jobs_lock held, after the update has been applied
+    to the cached job.
+    """
+    global _jobs_cache, _jobs_version, _jobs_journal_entries
+    entry = {"base": _jobs_journal_base, "id": job_id, "updates": updates}
+    try:
+        _ensure_data_dir()
+        with open(JOBS_JOURNAL_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+    except Exception as e:
+        logger.error(f"Error writing file {JOBS_JOURNAL_FILE}: {e}")
+        # Drop the in-memory change; the next read reloads from disk
+        _jobs_version += 1
+        return False
+    
+    _jobs_version += 1
+    _jobs_journal_entries += 1
+    # The cached jobs already include this update, so re-stamp the cache
+    # with the new version instead of re-parsing the files
+    if _jobs_cache is not None:
+        _jobs_cache = (get_jobs_version(), _jobs_cache[1], _jobs_cache[2])
+    return True
+
+
+def toggle_job_favorite(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Flip the is_favorite flag of a job.
+    
+    Args:
+        job_id: The job's unique identifier.
+    
+    Returns:
+        The updated job if saved successfully, None if not found or the
+        save failed.
+    """
+    with _jobs_lock:
+        _, index = _get_jobs_cache()
+        job = index.get(job_id)
+        if job is None:
+            return None
+        return update_job(job_id, {"is_favorite": not job.get("is_favorite", False)})
 
 
 def delete_job(job_id: str) -> bool:
@@ -219,7 +550,7 @@ def delete_job(job_id: str) -> bool:
 # Applications Functions
 # ============================================================
 
-def save_application(app_data: Dict[str, Any]) -> Optional[str]:
+def save_application(app_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Save a new job application.
     
@@ -228,7 +559,8 @@ def save_application(app_data: Dict[str, Any]) -> Optional[str]:
                   applied_at, resume_used, cover_letter, notes, etc.
     
     Returns:
-        The application ID if saved successfully, None otherwise.
+        The saved application (with id and timestamps) if saved
+        successfully, None otherwise.
     """
     with _applications_lock:
         applications = load_applications()
@@ -249,11 +581,11 @@ def save_application(app_data: Dict[str, Any]) -> Optional[str]:
         
         if _save_all_applications(applications):
             logger.info(f"Application {app_data['id']} saved successfully")
-            return app_data["id"]
+            return app_data
         return None
 
 
-def update_application(app_id: str, updates: Dict[str, Any]) -> bool:
+def update_application(app_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Update an existing application.
     
@@ -262,7 +594,7 @@ def update_application(app_id: str, updates: Dict[str, Any]) -> bool:
         updates: Dictionary of fields to update.
     
     Returns:
-        True if updated successfully, False otherwise.
+        The updated application if updated successfully, None otherwise.
     """
     with _applications_lock:
         applications = load_applications()
@@ -271,21 +603,32 @@ def update_application(app_id: str, updates: Dict[str, Any]) -> bool:
             if app.get("id") == app_id:
                 app.update(updates)
                 app["updated_at"] = datetime.utcnow().isoformat()
-                return _save_all_applications(applications)
+                if _save_all_applications(applications):
+                    return app
+                return None
         
-        return False
+        return None
 
 
 def load_applications() -> List[Dict[str, Any]]:
     """
     Load all applications.
     
+    The file is only re-read and re-parsed when the applications data
+    version changes.
+    
     Returns:
-        List of application dictionaries.
+        List of application dictionaries. The list is a fresh copy but the
+        application dictionaries are shared with the cache and must not be
+        mutated without saving them back.
     """
+    global _applications_cache
     with _applications_lock:
-        data = _read_json_file(APPLICATIONS_FILE, {"applications": []})
-        return data.get("applications", [])
+        version = get_applications_version()
+        if _applications_cache is None or _applications_cache[0] != version:
+            data = _read_json_file(APPLICATIONS_FILE, {"applications": []})
+            _applications_cache = (version, data.get("applications", []))
+        return list(_applications_cache[1])
 
 
 def get_application_by_id(app_id: str) -> Optional[Dict[str, Any]]:
@@ -319,6 +662,79 @@ def get_applications_by_status(status: str) -> List[Dict[str, Any]]:
     return [app for app in applications if app.get("status") == status]
 
 
+def _updated_at_key(app: Dict[str, Any]) -> str:
+    """Sort key for most-recently-updated ordering."""
+    return app.get("updated_at", "")
+
+
+def _get_application_search_index() -> Tuple[List[Dict[str, Any]], List[Tuple[str, str]]]:
+    """
+    Get applications with precomputed lowercase search keys.
+    
+    The index is rebuilt only when the applications data version changes,
+    so searches don't re-read the file or re-lowercase every record.
+    """
+    global _application_search_index
+    with _applications_lock:
+        version = get_applications_version()
+        if _application_search_index is None or _application_search_index[0] != version:
+            applications = load_applications()
+            keys = [
+                ((a.get("company_name") or "").lower(), (a.get("job_title") or "").lower())
+                for a in applications
+            ]
+            _application_search_index = (version, applications, keys)
+        return _application_search_index[1], _application_search_index[2]
+
+
+def query_applications(
+    status: Optional[str] = None,
+    search: Optional[str] = None,
+    company: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Filter, sort and paginate applications in the storage layer.
+    
+    Matching is done in a single pass over a cached search index; only the
+    requested page is sorted (most recently updated first) instead of the
+    whole list. Returned records are shared with the index and must not
+    be mutated.
+    
+    Args:
+        status: Exact status to filter by.
+        search: Case-insensitive substring of company name or job title.
+        company: Case-insensitive substring of company name.
+        limit: Maximum number of applications to return (None for all).
+        offset: Number of matching applications to skip.
+    
+    Returns:
+        Tuple of (page of applications, total number of matches).
+    """
+    search_lower = search.lower() if search else None
+    company_lower = company.lower() if company else None
+    
+    applications, keys = _get_application_search_index()
+    
+    matches = []
+    for app, (company_name, job_title) in zip(applications, keys):
+        if status and app.get("status") != status:
+            continue
+        if company_lower and company_lower not in company_name:
+            continue
+        if search_lower and search_lower not in company_name and search_lower not in job_title:
+            continue
+        matches.append(app)
+    
+    if limit is None:
+        page = sorted(matches, key=_updated_at_key, reverse=True)[offset:]
+    else:
+        page = heapq.nlargest(offset + limit, matches, key=_updated_at_key)[offset:]
+    
+    return page, len(matches)
+
+
 def delete_application(app_id: str) -> bool:
     """
     Delete an application by ID.
@@ -341,11 +757,35 @@ def delete_application(app_id: str) -> bool:
 
 def _save_all_applications(applications: List[Dict[str, Any]]) -> bool:
     """Internal function to save all applications."""
+    global _applications_version, _applications_cache
     apps_data = {
         "applications": applications,
         "updated_at": datetime.utcnow().isoformat()
     }
-    return _write_json_file(APPLICATIONS_FILE, apps_data)
+    success = _write_json_file(APPLICATIONS_FILE, apps_data)
+    _applications_version += 1
+    # What was just written is the new cache; a failed write leaves the
+    # cache stale by version, so the file is re-read next time
+    if success:
+        _applications_cache = (get_applications_version(), list(applications))
+    return success
+
+
+def get_applications_version() -> Tuple[int, int]:
+    """
+    Get a token that changes whenever the applications data changes.
+    
+    Combines an in-process write counter with the file's mtime so writes
+    made by other processes (e.g. scripts) are also detected.
+    
+    Returns:
+        Tuple of (write counter, file mtime in ns).
+    """
+    try:
+        mtime_ns = APPLICATIONS_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _applications_version, mtime_ns
 
 
 # ============================================================
@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional
 import traceback
 import uuid
 
-from app.services.llm_client import generate_json, LLMClientError
+from app.services.llm_client import generate_json, strip_json_fences, LLMClientError
 from app.logging_config import get_logger
 from app.services.data_store import get_job_by_id, load_student_profile
 from app.services.job_search import get_stored_jobs
@@ -103,10 +103,7 @@ def map_evidence(job_id: str, profile_data: Optional[Dict[str, Any]] = None) ->
         )
         
         # Extract JSON
-        import re
-        json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', response_text)
-        if json_match:
-            response_text = json_match.group(1)
+        response_text = strip_json_fences(response_text)
             
         try:
             mapping = json.loads(response_text)
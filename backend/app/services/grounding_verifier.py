@@ -8,7 +8,7 @@ to prevent hallucinations and ensure factual accuracy.
 
 import json
 from typing import Dict, Any, List, Optional
-from app.services.llm_client import generate_json, LLMClientError
+from app.services.llm_client import generate_json, strip_json_fences, LLMClientError
 from app.services.data_store import load_student_profile
 from app.logging_config import get_logger
 
@@ -87,10 +87,7 @@ def verify_content(content: str, context_type: str = "general") -> Dict[str, Any
         )
         
         # Handle markdown code blocks if present
-        import re
-        json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', response_text)
-        if json_match:
-            response_text = json_match.group(1)
+        response_text = strip_json_fences(response_text)
         
         try:
             result = json.loads(response_text)
@@ -4,13 +4,20 @@ Job Ranker Service
  ranks jobs based on match score and generates reasoning using LLM.
 """
 
+import asyncio
+import atexit
+import hashlib
 import json
 import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 import math
 
+import orjson
+
 from app.services.llm_client import generate_text, LLMClientError
 from app.logging_config import get_logger
 
@@ -22,6 +29,22 @@ APPLY_QUEUE_FILE = DATA_DIR / "apply_queue.json"
 
 _queue_lock = threading.RLock()
 
+# (queue file mtime in ns, job id -> job in queue order)
+_queue_cache: Optional[Tuple[int, "OrderedDict[str, Dict[str, Any]]"]] = None
+
+# Queue changes are kept in memory and written by flush_apply_queue(), at
+# most every QUEUE_FLUSH_INTERVAL seconds while the app's flush loop runs
+QUEUE_FLUSH_INTERVAL = 0.25
+_queue_dirty = False
+
+# Ranking results are reused for identical inputs within this many seconds
+RANK_CACHE_TTL = 60.0
+RANK_CACHE_MAX_ENTRIES = 128
+
+_rank_cache_lock = threading.Lock()
+# input hash -> (time.monotonic() when ranked, ranked jobs); oldest first
+_rank_cache: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+
 # Weights
 WEIGHT_SKILLS = 0.4
 WEIGHT_EXPERIENCE = 0.3
@@ -41,32 +64,120 @@ def _read_apply_queue() -> List[Dict[str, Any]]:
         logger.error(f"Error reading apply queue: {e}")
         return []
 
-def _write_apply_queue(queue: List[Dict[str, Any]]) -> bool:
+def _write_apply_queue(queue: Iterable[Dict[str, Any]]) -> bool:
     try:
         _ensure_data_dir()
-        with open(APPLY_QUEUE_FILE, "w", encoding="utf-8") as f:
-            json.dump({"queue": queue}, f, indent=2, default=str)
+        # Write to temp file first, then rename for atomicity
+        temp_path = APPLY_QUEUE_FILE.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"queue": list(queue)}, f, indent=2, default=str)
+        temp_path.replace(APPLY_QUEUE_FILE)
         return True
     except Exception as e:
         logger.error(f"Error writing apply queue: {e}")
         return False
 
-def calculate_skill_score(job_skills: List[str], profile_skills: List[str]) -> float:
+def _queue_file_mtime() -> int:
+    try:
+        return APPLY_QUEUE_FILE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+def _load_queue() -> "OrderedDict[str, Dict[str, Any]]":
+    """
+    Get the apply queue as an ordered id -> job mapping.
+    
+    The mapping is cached and only rebuilt from disk when the queue file
+    changes, giving O(1) lookup, removal and move-to-front. While there
+    are unflushed changes the in-memory queue is authoritative. Callers
+    must hold _queue_lock and call _mark_queue_dirty() after mutating it.
+    """
+    global _queue_cache
+    if _queue_cache is not None and _queue_dirty:
+        return _queue_cache[1]
+    
+    mtime_ns = _queue_file_mtime()
+    if _queue_cache is None or _queue_cache[0] != mtime_ns:
+        queue = OrderedDict((job["id"], job) for job in _read_apply_queue())
+        _queue_cache = (mtime_ns, queue)
+    return _queue_cache[1]
+
+def _mark_queue_dirty() -> None:
+    global _queue_dirty
+    _queue_dirty = True
+
+def flush_apply_queue() -> bool:
+    """Write pending apply queue changes to disk, if there are any."""
+    global _queue_cache, _queue_dirty
+    with _queue_lock:
+        if not _queue_dirty or _queue_cache is None:
+            return True
+        if not _write_apply_queue(_queue_cache[1].values()):
+            return False
+        _queue_dirty = False
+        # Our own write; the cached queue already matches it
+        _queue_cache = (_queue_file_mtime(), _queue_cache[1])
+        return True
+
+async def run_queue_flusher(interval: float = QUEUE_FLUSH_INTERVAL) -> None:
+    """
+    Flush pending apply queue changes every interval seconds until cancelled.
+    
+    Bursts of queue mutations are coalesced into a single write. A final
+    flush runs when the task is cancelled at shutdown.
+    """
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            if _queue_dirty:
+                await asyncio.to_thread(flush_apply_queue)
+    finally:
+        flush_apply_queue()
+
+# Don't lose queued changes if the process exits without running the loop
+atexit.register(flush_apply_queue)
+
+def _skill_matcher(profile_skills: List[str]) -> Callable[[str], bool]:
+    """
+    Build a memoized "does the profile cover this job skill" check.
+    
+    Profile skills are normalized once, and each distinct job skill is
+    resolved once, so ranking many jobs that share skills doesn't repeat
+    the substring scan.
+    """
+    profile_skills_norm = {s.lower() for s in profile_skills}
+    memo: Dict[str, bool] = {}
+    
+    def matches(j_skill: str) -> bool:
+        result = memo.get(j_skill)
+        if result is None:
+            # Direct match or substring match
+            result = j_skill in profile_skills_norm or any(
+                j_skill in p_skill or p_skill in j_skill for p_skill in profile_skills_norm
+            )
+            memo[j_skill] = result
+        return result
+    
+    return matches
+
+def calculate_skill_score(
+    job_skills: List[str],
+    profile_skills: List[str],
+    matcher: Optional[Callable[[str], bool]] = None,
+) -> float:
     if not job_skills:
         return 100.0  # No specific skills required
     
     # Normalize
     job_skills_norm = {s.lower() for s in job_skills}
-    profile_skills_norm = {s.lower() for s in profile_skills}
     
     if not job_skills_norm:
         return 100.0
 
-    matched = 0
-    for j_skill in job_skills_norm:
-        # Direct match or substring match
-        if any(j_skill in p_skill or p_skill in j_skill for p_skill in profile_skills_norm):
-            matched += 1
+    if matcher is None:
+        matcher = _skill_matcher(profile_skills)
+    
+    matched = sum(1 for j_skill in job_skills_norm if matcher(j_skill))
             
     return (matched / len(job_skills_norm)) * 100.0
 
@@ -174,11 +285,15 @@ def rank_jobs(
         # Let's just use number of experience entries * 1.5 as a proxy for now.
         student_years += 1.5
     
+    profile_skills = profile.get("skills", [])
+    skill_matcher = _skill_matcher(profile_skills)
+    
     for job in jobs:
         # 1. Skill Score
         skill_score = calculate_skill_score(
             job.get("skills_required", []),
-            profile.get("skills", [])
+            profile_skills,
+            matcher=skill_matcher,
         )
         
         # 2. Experience Score
@@ -223,35 +338,32 @@ def rank_jobs(
 def add_to_apply_queue(jobs: List[Dict[str, Any]]) -> int:
     """Add ranked jobs to the apply queue."""
     with _queue_lock:
-        queue = _read_apply_queue()
-        existing_ids = {item["id"] for item in queue}
+        queue = _load_queue()
         
         added_count = 0
         for job in jobs:
-            if job["id"] not in existing_ids:
+            if job["id"] not in queue:
                 job["queued_at"] = str(datetime.now())
                 job["status"] = "queued"
-                queue.append(job)
-                existing_ids.add(job["id"])
+                queue[job["id"]] = job
                 added_count += 1
                 
-        _write_apply_queue(queue)
+        _mark_queue_dirty()
         return added_count
 
 def get_queued_jobs() -> List[Dict[str, Any]]:
     """Get all queued jobs."""
     with _queue_lock:
-        return _read_apply_queue()
+        return list(_load_queue().values())
 
 def remove_queued_job(job_id: str) -> bool:
     """Remove a job from the queue."""
     with _queue_lock:
-        queue = _read_apply_queue()
-        initial_len = len(queue)
-        queue = [j for j in queue if j.get("id") != job_id]
+        queue = _load_queue()
         
-        if len(queue) < initial_len:
-            return _write_apply_queue(queue)
+        if queue.pop(job_id, None) is not None:
+            _mark_queue_dirty()
+            return True
         return False
 
 def reorder_queue(job_ids: List[str]) -> List[Dict[str, Any]]:
@@ -260,22 +372,51 @@ def reorder_queue(job_ids: List[str]) -> List[Dict[str, Any]]:
     Any existing jobs not in the list are appended at the end.
     """
     with _queue_lock:
-        current_queue = _read_apply_queue()
-        job_map = {j["id"]: j for j in current_queue}
-        
-        new_queue = []
-        seen_ids = set()
+        queue = _load_queue()
         
-        # Add in requested order
-        for jid in job_ids:
-            if jid in job_map:
-                new_queue.append(job_map[jid])
-                seen_ids.add(jid)
-        
-        # Append remaining
-        for job in current_queue:
-            if job["id"] not in seen_ids:
-                new_queue.append(job)
+        # Moving to the front in reverse leaves the requested order first,
+        # followed by the remaining jobs in their current order
+        for jid in reversed(job_ids):
+            if jid in queue:
+                queue.move_to_end(jid, last=False)
                 
-        _write_apply_queue(new_queue)
-        return new_queue
+        _mark_queue_dirty()
+        return list(queue.values())
+
+def rank_jobs_cached(
+    jobs: List[Dict[str, Any]],
+    profile: Dict[str, Any],
+    remote_only: bool = False,
+    visa_required: bool = False,
+    preferred_locations: List[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    rank_jobs() with a short-lived cache keyed by a hash of all inputs.
+    
+    Repeated ranking of the same jobs for the same profile and filters
+    (e.g. a UI refresh) skips scoring and the LLM reasoning calls. Because
+    the jobs themselves are part of the key, any change to them is a miss.
+    Callers get their own copies of the ranked job dicts.
+    """
+    key = hashlib.sha256(orjson.dumps(
+        [jobs, profile, remote_only, visa_required, preferred_locations],
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    )).hexdigest()
+    now = time.monotonic()
+    
+    with _rank_cache_lock:
+        hit = _rank_cache.get(key)
+        if hit is not None and now - hit[0] < RANK_CACHE_TTL:
+            _rank_cache.move_to_end(key)
+            return [dict(job) for job in hit[1]]
+    
+    ranked = rank_jobs(jobs, profile, remote_only, visa_required, preferred_locations)
+    
+    with _rank_cache_lock:
+        _rank_cache[key] = (now, [dict(job) for job in ranked])
+        _rank_cache.move_to_end(key)
+        while len(_rank_cache) > RANK_CACHE_MAX_ENTRIES:
+            _rank_cache.popitem(last=False)
+    
+    return ranked
@@ -7,6 +7,8 @@ fast inference API with Llama models.
 
 import requests
 import json
+import re
+import threading
 from typing import Optional
 from app.config import settings
 from app.logging_config import get_logger
@@ -19,6 +21,12 @@ GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 # Model to use - Llama 3.3 70B is powerful and fast
 GROQ_MODEL = "llama-3.3-70b-versatile"
 
+# Caps concurrent Groq requests so parallel generation stays within rate limits
+_request_slots = threading.BoundedSemaphore(settings.llm_max_concurrency)
+
+# Markdown code fence some models wrap JSON output in, despite instructions
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+
 
 class LLMClientError(Exception):
     """Exception for LLM client errors."""
@@ -47,12 +55,13 @@ def _make_request(
     }
     
     try:
-        response = requests.post(
-            GROQ_API_URL,
-            headers=headers,
-            json=payload,
-            timeout=60
-        )
+        with _request_slots:
+            response = requests.post(
+                GROQ_API_URL,
+                headers=headers,
+                json=payload,
+                timeout=60
+            )
         
         if response.status_code != 200:
             error_detail = response.text
@@ -132,3 +141,15 @@ def generate_json(
         max_tokens=max_tokens,
         temperature=temperature
     )
+
+
+def strip_json_fences(text: str) -> str:
+    """
+    Return the contents of the first ```json code fence in an LLM response.
+    
+    Text without a code fence is returned unchanged.
+    """
+    if "```" not in text:
+        return text
+    match = _JSON_FENCE_RE.search(text)
+    return match.group(1) if match else text
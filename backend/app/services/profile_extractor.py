@@ -6,10 +6,9 @@ Extracts: Education, Projects, Experience, Skills, Links
 """
 
 import json
-import re
 from typing import Any, Dict, List, Optional
 
-from app.services.llm_client import generate_json, LLMClientError
+from app.services.llm_client import generate_json, strip_json_fences, LLMClientError
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -102,9 +101,7 @@ def extract_profile_from_text(resume_text: str) -> Dict[str, Any]:
         )
         
         # Extract JSON from response (handle markdown code blocks)
-        json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', response_text)
-        if json_match:
-            response_text = json_match.group(1)
+        response_text = strip_json_fences(response_text)
         
         # Parse JSON
         try:
@@ -6,14 +6,13 @@ Uses Groq LLM to generate professional descriptions and map items to relevant sk
 """
 
 import json
-import re
 import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from app.services.llm_client import generate_json, LLMClientError
+from app.services.llm_client import generate_json, strip_json_fences, LLMClientError
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -25,6 +24,9 @@ PROOF_PACK_FILE = DATA_DIR / "proof_pack.json"
 # Thread lock for concurrent access
 _proof_lock = threading.RLock()
 
+# Bumped on every proof pack write; combined with the file mtime as a version token
+_proof_version = 0
+
 # Prompt for proof pack generation
 PROOF_PACK_PROMPT = """You are a technical career coach. Identify the most impressive artifacts/links from the student's profile and create a "Proof Pack".
 
@@ -72,17 +74,32 @@ def _read_proof_packs() -> Dict[str, Any]:
 
 def _write_proof_packs(data: Dict[str, Any]) -> bool:
     """Write to the proof pack JSON file."""
+    global _proof_version
     try:
         _ensure_data_dir()
         temp_path = PROOF_PACK_FILE.with_suffix(".tmp")
         with open(temp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, default=str)
         temp_path.replace(PROOF_PACK_FILE)
+        _proof_version += 1
         return True
     except Exception as e:
         logger.error(f"Error writing proof pack file: {e}")
         return False
 
+def get_proof_pack_version() -> Tuple[int, int]:
+    """
+    Get a token that changes whenever the stored proof packs change.
+    
+    Returns:
+        Tuple of (write counter, file mtime in ns).
+    """
+    try:
+        mtime_ns = PROOF_PACK_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _proof_version, mtime_ns
+
 def build_proof_pack_from_profile(profile_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Generate a Proof Pack from student profile data using LLM.
@@ -111,9 +128,7 @@ def build_proof_pack_from_profile(profile_data: Dict[str, Any]) -> List[Dict[str
         )
         
         # Extract JSON
-        json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', response_text)
-        if json_match:
-            response_text = json_match.group(1)
+        response_text = strip_json_fences(response_text)
             
         try:
             items = json.loads(response_text)
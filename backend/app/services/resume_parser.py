@@ -1,13 +1,15 @@
 """
 Resume Parser Service
 
-Extracts text content from PDF resume files using pdfplumber.
+Extracts text content from PDF resume files using PyMuPDF, with
+pdfplumber/pypdf/pdfminer.six fallbacks.
 """
 
 import io
 from typing import Optional
 
 import pdfplumber
+import pymupdf
 
 from app.logging_config import get_logger
 
@@ -44,6 +46,10 @@ def extract_text_from_pdf(file_content: bytes) -> str:
     """
     Extract text content from a PDF file.
     
+    PyMuPDF is tried first since it is much faster than the pure-Python
+    parsers; pdfplumber, pypdf and pdfminer.six are kept as fallbacks for
+    files it can't read.
+    
     Args:
         file_content: The raw bytes of the PDF file.
         
@@ -60,90 +66,114 @@ def extract_text_from_pdf(file_content: bytes) -> str:
         # Create a file-like object from bytes
         pdf_stream = io.BytesIO(file_content)
         
-    # Track errors for debugging
-    errors = []
-    
-    # ---------------------------------------------------------
-    # Attempt 1: pdfplumber (Best for layout)
-    # ---------------------------------------------------------
-    try:
-        with pdfplumber.open(pdf_stream) as pdf:
-            if len(pdf.pages) == 0:
-                errors.append("pdfplumber: PDF has no pages")
-            else:
-                for page in pdf.pages:
+        extracted_text = []
+        
+        # Track errors for debugging
+        errors = []
+        
+        # ---------------------------------------------------------
+        # Attempt 1: PyMuPDF (Fastest, MuPDF C library)
+        # ---------------------------------------------------------
+        try:
+            with pymupdf.open(stream=file_content, filetype="pdf") as doc:
+                if doc.page_count == 0:
+                    errors.append("pymupdf: PDF has no pages")
+                else:
+                    for page in doc:
+                        text = page.get_text("text")
+                        if text and text.strip():
+                            extracted_text.append(text)
+                    if extracted_text:
+                        logger.info("Successfully extracted text using PyMuPDF")
+        except (pymupdf.FileDataError, RuntimeError, ValueError) as e:
+            logger.warning(f"PyMuPDF extraction failed: {e}")
+            errors.append(f"pymupdf: {str(e)}")
+        
+        # ---------------------------------------------------------
+        # Attempt 2: pdfplumber (Best for layout)
+        # ---------------------------------------------------------
+        if not extracted_text:
+            try:
+                with pdfplumber.open(pdf_stream) as pdf:
+                    if len(pdf.pages) == 0:
+                        errors.append("pdfplumber: PDF has no pages")
+                    else:
+                        for page in pdf.pages:
+                            text = page.extract_text()
+                            if text:
+                                extracted_text.append(text)
+                        if extracted_text:
+                            logger.info("Successfully extracted text using pdfplumber fallback")
+            except Exception as e:
+                logger.warning(f"pdfplumber extraction failed: {e}")
+                errors.append(f"pdfplumber: {str(e)}")
+        
+        # ---------------------------------------------------------
+        # Attempt 3: pypdf (Best for resilience)
+        # ---------------------------------------------------------
+        if not extracted_text:
+            try:
+                import pypdf
+                pdf_stream.seek(0)
+                reader = pypdf.PdfReader(pdf_stream)
+                pypdf_text = []
+                for page in reader.pages:
                     text = page.extract_text()
                     if text:
-                        extracted_text.append(text)
-                if extracted_text:
-                    logger.info("Successfully extracted text using pdfplumber")
-    except Exception as e:
-        logger.warning(f"pdfplumber extraction failed: {e}")
-        errors.append(f"pdfplumber: {str(e)}")
-
-    # ---------------------------------------------------------
-    # Attempt 2: pypdf (Best for resilience)
-    # ---------------------------------------------------------
-    if not extracted_text:
-        try:
-            import pypdf
-            pdf_stream.seek(0)
-            reader = pypdf.PdfReader(pdf_stream)
-            pypdf_text = []
-            for page in reader.pages:
-                text = page.extract_text()
-                if text:
-                    pypdf_text.append(text)
-            
-            if pypdf_text:
-                extracted_text = pypdf_text
-                logger.info("Successfully extracted text using pypdf fallback")
-        except Exception as e:
-            logger.warning(f"pypdf extraction failed: {e}")
-            errors.append(f"pypdf: {str(e)}")
-
-    # ---------------------------------------------------------
-    # Attempt 3: pdfminer.six (Deepest extraction)
-    # ---------------------------------------------------------
-    if not extracted_text:
-        try:
-            from pdfminer.high_level import extract_text as extract_text_miner
-            pdf_stream.seek(0)
-            miner_text = extract_text_miner(pdf_stream)
-            if miner_text and len(miner_text.strip()) > 10:
-                extracted_text = [miner_text]
-                logger.info("Successfully extracted text using pdfminer.six fallback")
-        except Exception as e:
-            logger.warning(f"pdfminer extraction failed: {e}")
-            errors.append(f"pdfminer: {str(e)}")
-
-    # ---------------------------------------------------------
-    # Final Validation
-    # ---------------------------------------------------------
-    if not extracted_text:
-        error_details = "; ".join(errors)
-        raise ResumeParseError(
-            f"Could not extract text. Failed all methods: {error_details}. "
-            "Please ensure the file is not encrypted/locked."
-        )
-    
-    # Join all pages with newlines
-    full_text = "\n\n".join(extracted_text)
-    
-    logger.info(f"Successfully extracted {len(full_text)} characters from PDF")
-    return full_text
+                        pypdf_text.append(text)
+                
+                if pypdf_text:
+                    extracted_text = pypdf_text
+                    logger.info("Successfully extracted text using pypdf fallback")
+            except Exception as e:
+                logger.warning(f"pypdf extraction failed: {e}")
+                errors.append(f"pypdf: {str(e)}")
         
-except ResumeParseError:
-    raise
-except Exception as e:
-    logger.error(f"Failed to parse PDF: {e}")
-    raise ResumeParseError(f"Failed to parse PDF: {str(e)}")
+        # ---------------------------------------------------------
+        # Attempt 4: pdfminer.six (Deepest extraction)
+        # ---------------------------------------------------------
+        if not extracted_text:
+            try:
+                from pdfminer.high_level import extract_text as extract_text_miner
+                pdf_stream.seek(0)
+                miner_text = extract_text_miner(pdf_stream)
+                if miner_text and len(miner_text.strip()) > 10:
+                    extracted_text = [miner_text]
+                    logger.info("Successfully extracted text using pdfminer.six fallback")
+            except Exception as e:
+                logger.warning(f"pdfminer extraction failed: {e}")
+                errors.append(f"pdfminer: {str(e)}")
+        
+        # ---------------------------------------------------------
+        # Final Validation
+        # ---------------------------------------------------------
+        if not extracted_text:
+            error_details = "; ".join(errors)
+            raise ResumeParseError(
+                f"Could not extract text. Failed all methods: {error_details}. "
+                "Please ensure the file is not encrypted/locked."
+            )
+        
+        # Join all pages with newlines
+        full_text = "\n\n".join(extracted_text)
+        
+        logger.info(f"Successfully extracted {len(full_text)} characters from PDF")
+        return full_text
+        
+    except ResumeParseError:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to parse PDF: {e}")
+        raise ResumeParseError(f"Failed to parse PDF: {str(e)}")
 
 
 def get_text_preview(text: str, max_length: int = 500) -> str:
     """
     Get a preview of the extracted text.
     
+    Only the first max_length characters are examined, so the cost doesn't
+    grow with the length of the resume.
+    
     Args:
         text: The full extracted text.
         max_length: Maximum length of the preview.
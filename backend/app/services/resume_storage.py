@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from app.logging_config import get_logger
+from app.services.resume_parser import get_text_preview
 
 logger = get_logger(__name__)
 
@@ -22,6 +23,9 @@ RESUMES_FILE = DATA_DIR / "resumes.json"
 # Thread lock for concurrent access
 _resumes_lock = threading.RLock()
 
+# Listing metadata built from the file, keyed by (file mtime, preview length)
+_metadata_cache: Dict[str, Any] = {"key": None, "resumes": []}
+
 
 def _ensure_data_dir() -> None:
     """Ensure the data directory exists."""
@@ -48,6 +52,7 @@ def _write_resumes_file(data: Dict[str, Any]) -> bool:
         with open(temp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, default=str)
         temp_path.replace(RESUMES_FILE)
+        _metadata_cache["key"] = None
         return True
     except Exception as e:
         logger.error(f"Error writing resumes file: {e}")
@@ -58,6 +63,7 @@ def save_resume_data(
     filename: str,
     extracted_text: str,
     file_size: int,
+    content_hash: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Save parsed resume data to storage.
@@ -66,6 +72,7 @@ def save_resume_data(
         filename: Original filename of the uploaded resume.
         extracted_text: The extracted text content from the PDF.
         file_size: Size of the uploaded file in bytes.
+        content_hash: Hash of the uploaded file bytes, used to spot re-uploads.
         
     Returns:
         The saved resume record with ID, or None if save failed.
@@ -78,6 +85,7 @@ def save_resume_data(
             "filename": filename,
             "extracted_text": extracted_text,
             "file_size": file_size,
+            "content_hash": content_hash,
             "created_at": datetime.utcnow().isoformat(),
         }
         
@@ -100,6 +108,16 @@ def get_resume_by_id(resume_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def get_resume_by_hash(content_hash: str) -> Optional[Dict[str, Any]]:
+    """Get the most recent resume record uploaded with the given content hash."""
+    with _resumes_lock:
+        data = _read_resumes_file()
+        for resume in reversed(data["resumes"]):
+            if resume.get("content_hash") == content_hash:
+                return resume
+        return None
+
+
 def get_all_resumes() -> List[Dict[str, Any]]:
     """Get all resume records."""
     with _resumes_lock:
@@ -107,6 +125,44 @@ def get_all_resumes() -> List[Dict[str, Any]]:
         return data.get("resumes", [])
 
 
+def get_all_resumes_metadata(preview_chars: int = 200) -> List[Dict[str, Any]]:
+    """
+    Get listing metadata for all resumes without their full extracted text.
+
+    Each record carries a text_preview of at most preview_chars characters
+    in place of extracted_text. The trimmed list is rebuilt only when the
+    resumes file changes, so repeated listings don't copy every full text.
+
+    Args:
+        preview_chars: Maximum length of each text preview.
+
+    Returns:
+        List of resume metadata records.
+    """
+    with _resumes_lock:
+        try:
+            mtime = RESUMES_FILE.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        key = (mtime, preview_chars)
+
+        if _metadata_cache["key"] != key:
+            data = _read_resumes_file()
+            _metadata_cache["resumes"] = [
+                {
+                    "id": r["id"],
+                    "filename": r["filename"],
+                    "file_size": r["file_size"],
+                    "created_at": r["created_at"],
+                    "text_preview": get_text_preview(r.get("extracted_text", ""), preview_chars),
+                }
+                for r in data.get("resumes", [])
+            ]
+            _metadata_cache["key"] = key
+
+        return [dict(r) for r in _metadata_cache["resumes"]]
+
+
 def get_latest_resume() -> Optional[Dict[str, Any]]:
     """Get the most recently uploaded resume."""
     with _resumes_lock:
@@ -117,8 +173,14 @@ def get_latest_resume() -> Optional[Dict[str, Any]]:
         return None
 
 
-def delete_resume(resume_id: str) -> bool:
-    """Delete a resume record by ID."""
+def delete_resume(resume_id: str) -> Optional[bool]:
+    """
+    Delete a resume record by ID.
+    
+    Returns:
+        True if deleted, False if the write failed, or None if no resume
+        has the given ID.
+    """
     with _resumes_lock:
         data = _read_resumes_file()
         original_count = len(data["resumes"])
@@ -126,4 +188,4 @@ def delete_resume(resume_id: str) -> bool:
         
         if len(data["resumes"]) < original_count:
             return _write_resumes_file(data)
-        return False
+        return None
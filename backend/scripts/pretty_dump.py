@@ -0,0 +1,50 @@
+"""
+Pretty Dump Script
+
+Prints a data file with indentation for reading. answer_library.json and
+apply_policy.json are written compactly. JSON lines files (audit_logs.jsonl,
+bullet_bank.jsonl) are printed one indented record at a time.
+
+Usage: python scripts/pretty_dump.py [FILE ...]
+
+Bare file names are looked up in both data directories the services use:
+backend/data (e.g. apply_policy.json, audit_logs.jsonl) and backend/app/data
+(e.g. answer_library.json, bullet_bank.jsonl).
+"""
+
+import json
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DATA_DIRS = (BACKEND_DIR / "data", BACKEND_DIR / "app" / "data")
+
+def _resolve(path: Path) -> Path:
+    if path.exists():
+        return path
+    for data_dir in DATA_DIRS:
+        candidate = data_dir / path
+        if candidate.exists():
+            return candidate
+    return path
+
+def pretty_dump(path: Path):
+    path = _resolve(path)
+    if not path.exists():
+        print(f"File not found: {path} (also looked in {', '.join(str(d) for d in DATA_DIRS)})")
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        if path.suffix == ".jsonl":
+            for line in f:
+                if line.strip():
+                    print(json.dumps(json.loads(line), indent=2, ensure_ascii=False))
+        else:
+            print(json.dumps(json.load(f), indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    for name in sys.argv[1:]:
+        pretty_dump(Path(name))
@@ -0,0 +1,89 @@
+"""
+Upgrade DB Schema Script
+
+Brings a PostgreSQL database created by an older init_db up to the current
+models. init_db only creates missing tables, so existing tables need this
+once:
+- job_applications.status moves from the applicationstatus enum (member
+  names, e.g. 'PENDING') to application_status (values, e.g. 'pending')
+- created_at/updated_at (and job_applications.applied_at) become
+  timestamptz, with now() as the server default for created_at/updated_at.
+  Old values were stored as naive UTC and are converted as such.
+
+Each step checks the current schema first, so running it again is harmless.
+
+Usage: python scripts/upgrade_db_schema.py   (uses DATABASE_URL from settings)
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend directory to path so we can import app modules
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_DIR))
+
+from sqlalchemy import text
+
+from app.database import engine
+
+UPGRADE_STATEMENTS = [
+    # Status enum: old type name and member-name labels -> new type with value labels
+    """
+    DO $$
+    BEGIN
+        IF EXISTS (SELECT 1 FROM pg_type WHERE typname = 'applicationstatus') THEN
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'application_status') THEN
+                CREATE TYPE application_status AS ENUM (
+                    'pending', 'applied', 'interviewing', 'offered', 'rejected', 'withdrawn'
+                );
+            END IF;
+            ALTER TABLE job_applications
+                ALTER COLUMN status TYPE application_status
+                USING lower(status::text)::application_status;
+            DROP TYPE applicationstatus;
+        END IF;
+    END $$
+    """,
+    # Timestamps: naive UTC -> timestamptz, filled in by the database
+    """
+    DO $$
+    DECLARE
+        col record;
+    BEGIN
+        FOR col IN
+            SELECT table_name, column_name, data_type
+            FROM information_schema.columns
+            WHERE table_schema = current_schema()
+              AND (
+                  (table_name IN ('users', 'resumes', 'job_applications')
+                   AND column_name IN ('created_at', 'updated_at'))
+                  OR (table_name = 'job_applications' AND column_name = 'applied_at')
+              )
+        LOOP
+            IF col.data_type = 'timestamp without time zone' THEN
+                EXECUTE format(
+                    'ALTER TABLE %I ALTER COLUMN %I TYPE timestamptz USING %I AT TIME ZONE ''UTC''',
+                    col.table_name, col.column_name, col.column_name
+                );
+            END IF;
+            IF col.column_name <> 'applied_at' THEN
+                EXECUTE format(
+                    'ALTER TABLE %I ALTER COLUMN %I SET DEFAULT now()',
+                    col.table_name, col.column_name
+                );
+            END IF;
+        END LOOP;
+    END $$
+    """,
+]
+
+async def upgrade():
+    async with engine.begin() as conn:
+        for statement in UPGRADE_STATEMENTS:
+            await conn.execute(text(statement))
+    await engine.dispose()
+    print("Database schema is up to date.")
+
+if __name__ == "__main__":
+    asyncio.run(upgrade())